@@ -8,53 +8,262 @@ for managing Cinder volume services within a snap environment.
 """
 
 import abc
+import concurrent.futures
+import functools
+import hashlib
 import inspect
 import logging
+import os
+import stat
 import typing
 from pathlib import Path
 
 import jinja2
 import pydantic
-from snaphelpers import Snap
 
 from . import configuration, context, error, log, services, template
 
+if typing.TYPE_CHECKING:
+    from snaphelpers import Snap
+
 ETC_CINDER = Path("etc/cinder")
 ETC_SSL_CERTS = Path("etc/ssl/certs")
 
 
+logger = logging.getLogger(__name__)
+
 CONF = typing.TypeVar("CONF", bound=configuration.BaseConfiguration)
 
+_ENVIRONMENTS: dict[tuple[Path, ...], jinja2.Environment] = {}
+
+
+def _environment(search_path: typing.Sequence[Path]) -> jinja2.Environment:
+    """Return the Jinja environment for a templates search path.
+
+    Environments are shared across calls so that compiled templates are
+    reused instead of being parsed again on every hook invocation.
+    """
+    key = tuple(search_path)
+    env = _ENVIRONMENTS.get(key)
+    if env is None:
+        env = jinja2.Environment(
+            loader=jinja2.FileSystemLoader(searchpath=key),
+            keep_trailing_newline=True,
+            autoescape=jinja2.select_autoescape(),
+            cache_size=-1,
+        )
+        env.globals.update(
+            {
+                "backend_ctx": context.backend_ctx,
+                "cinder_name": context.cinder_name,
+                "cinder_ctx": context.cinder_ctx,
+            }
+        )
+        _ENVIRONMENTS[key] = env
+    return env
+
+
+def _locations(snap: "Snap") -> dict[str, Path]:
+    """Return the snap paths templates and directories can be placed in."""
+    return {"common": snap.paths.common, "data": snap.paths.data}
+
+
+def _ensure_directory(path: Path, mode: int | None = None) -> None:
+    """Create ``path`` if missing and apply ``mode`` only when it differs."""
+    current: int | None
+    try:
+        current = path.stat().st_mode
+    except FileNotFoundError:
+        path.mkdir(parents=True, exist_ok=True)
+        current = None
+    else:
+        if not stat.S_ISDIR(current):
+            # let mkdir raise the usual FileExistsError
+            path.mkdir(parents=True, exist_ok=True)
+    if mode is not None and (current is None or stat.S_IMODE(current) != mode):
+        path.chmod(mode)
+
+
+@functools.cache
+def _templates_search_path(common: Path, class_dir: Path | None) -> tuple[Path, ...]:
+    """Return the templates search path for a snap common path and class."""
+    return (
+        common / "templates",
+        *((class_dir,) if class_dir is not None else ()),
+        Path(__file__).parent / "templates",
+    )
+
+
+@functools.cache
+def _config_field_names(
+    config_type: typing.Type[pydantic.BaseModel],
+) -> tuple[str, ...]:
+    """Return the top level field names of a configuration model."""
+    return tuple(config_type.model_fields)
+
+
+@functools.cache
+def _is_flat_model(model_type: typing.Type[pydantic.BaseModel]) -> bool:
+    """Return whether a model dumps to its raw values without serializers."""
+    decorators = model_type.__pydantic_decorators__
+    return not (
+        model_type.model_computed_fields
+        or decorators.field_serializers
+        or decorators.model_serializers
+        or any(field.exclude for field in model_type.model_fields.values())
+    )
+
+
+_NESTED_TYPES = (pydantic.BaseModel, dict, list, set, frozenset, tuple)
+
+
+def _dump_backend_config(config: pydantic.BaseModel) -> dict[str, typing.Any]:
+    """Dump a backend configuration like ``model_dump``.
+
+    Flat models holding only scalar values are read straight from the
+    instance, anything else goes through the pydantic serializer.
+    """
+    if _is_flat_model(type(config)):
+        values = {**config.__dict__, **(config.__pydantic_extra__ or {})}
+        if not any(isinstance(value, _NESTED_TYPES) for value in values.values()):
+            return values
+    return config.model_dump()
+
+
+_SERVICE_TRIGGER_FILES: dict[
+    typing.Type[services.OpenStackService], frozenset[str]
+] = {}
+
+
+def _service_trigger_files(
+    service: typing.Type[services.OpenStackService],
+) -> frozenset[str]:
+    """Return the relative paths whose modification restarts ``service``."""
+    files = _SERVICE_TRIGGER_FILES.get(service)
+    if files is None:
+        files = frozenset(
+            str(path)
+            for path in (*service.configuration_files, *service.restart_trigger_files)
+        )
+        _SERVICE_TRIGGER_FILES[service] = files
+    return files
+
+
+_HASH_CHUNK_SIZE = 64 * 1024
+_LEAF_TYPES = frozenset({int, float, bool, type(None)})
+_MAX_TEMPLATE_WORKERS = 8
+
+
+# stat signature and digest of files seen by this process, so unchanged
+# files are not read back on every render
+_FILE_DIGESTS: dict[Path, tuple[tuple[int, int, int, int], bytes]] = {}
+
+
+def _stat_signature(st: os.stat_result) -> tuple[int, int, int, int]:
+    """Return the stat fields that change whenever a file is rewritten."""
+    return st.st_ino, st.st_size, st.st_mtime_ns, st.st_ctime_ns
+
+
+def _digest(payload: bytes) -> bytes:
+    """Return the blake2b digest used to compare rendered files."""
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+
+def _file_matches(path: Path, payload: bytes) -> bool:
+    """Return whether the file at path already holds payload.
+
+    Sizes are compared first so most changes are detected without reading
+    the file; when they match the file is streamed through blake2b, unless
+    it is unchanged since this process last hashed or wrote it.
+    """
+    try:
+        st = path.stat()
+        if st.st_size != len(payload):
+            return False
+        signature = _stat_signature(st)
+        cached = _FILE_DIGESTS.get(path)
+        if cached is not None and cached[0] == signature:
+            return cached[1] == _digest(payload)
+        digest = hashlib.blake2b(digest_size=16)
+        with path.open("rb") as f:
+            while chunk := f.read(_HASH_CHUNK_SIZE):
+                digest.update(chunk)
+    except FileNotFoundError:
+        _FILE_DIGESTS.pop(path, None)
+        return False
+    _FILE_DIGESTS[path] = (signature, digest.digest())
+    return digest.digest() == _digest(payload)
+
+
+# destination, payload and mode of a changed template
+_PendingWrite = tuple[Path, bytes, int]
+
+
+def _write_file(path: Path, payload: bytes, mode: int) -> None:
+    """Write payload to path with a single open and set its mode.
+
+    The mode given to ``open`` only applies on creation and is subject to
+    the umask, hence the ``fchmod`` on the already open descriptor.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view) :]
+        os.fchmod(fd, mode)
+        _FILE_DIGESTS[path] = (_stat_signature(os.fstat(fd)), _digest(payload))
+    finally:
+        os.close(fd)
+
+
+@functools.lru_cache(maxsize=512)
+def _value_template(value: str) -> jinja2.Template:
+    """Compile a backend configuration value as a Jinja template."""
+    return jinja2.Template(value)
+
+
+def _render_value(value: str, context: typing.Mapping[str, typing.Any]) -> str:
+    """Render a backend configuration value as a Jinja template.
+
+    Plain strings are returned as is, unless Jinja would alter them by
+    normalizing line endings or dropping a trailing newline.
+    """
+    if "{" in value or "\r" in value or value.endswith("\n"):
+        return _value_template(value).render(context)
+    return value
+
 
 class CinderVolume(typing.Generic[CONF], abc.ABC):
     """Abstract base class for Cinder volume service implementations."""
 
     def __init__(self) -> None:
         """Initialize the CinderVolume instance."""
+        self._config: CONF | None = None
+        self._render_context: dict[str, typing.Mapping[str, str]] | None = None
         self._contexts: typing.Sequence[context.Context] | None = None
         self._backend_contexts: context.CinderBackendContexts | None = None
 
     @classmethod
-    def install_hook(cls, snap: Snap) -> None:
+    def install_hook(cls, snap: "Snap") -> None:
         """Install hook for the Cinder volume snap."""
         log.setup_logging(snap.paths.common / "hooks.log")
         cls().install(snap)
 
     @classmethod
-    def configure_hook(cls, snap: Snap) -> None:
+    def configure_hook(cls, snap: "Snap") -> None:
         """Configure hook for the Cinder volume snap."""
         log.setup_logging(snap.paths.common / "hooks.log")
         try:
             cls().configure(snap)
         except error.CinderError:
-            logging.warning("Configuration not complete", exc_info=True)
+            logger.warning("Configuration not complete", exc_info=True)
 
-    def install(self, snap: Snap) -> None:
+    def install(self, snap: "Snap") -> None:
         """Install the Cinder volume service."""
         self.setup_dirs(snap)
         self.template(snap)
 
-    def configure(self, snap: Snap) -> None:
+    def configure(self, snap: "Snap") -> None:
         """Configure the Cinder volume service."""
         # Always clear existing backend configuration files first
         # This ensures cleanup even when no backends are configured
@@ -65,13 +274,13 @@ class CinderVolume(typing.Generic[CONF], abc.ABC):
         except error.CinderError as e:
             # If no backends are configured, just clear configs and exit
             if "At least one backend must be enabled" in str(e):
-                logging.info("No backends configured, cleared all backend configs")
+                logger.info("No backends configured, cleared all backend configs")
                 return
             # Re-raise other configuration errors
             raise
 
         self.setup_dirs(snap, backend_contexts)
-        modified = self.template(snap)
+        modified = self.template(snap, backend_contexts)
         backend_tpls = []
         for backend_context in backend_contexts.contexts.values():
             backend_tpls.extend(backend_context.template_files())
@@ -80,34 +289,30 @@ class CinderVolume(typing.Generic[CONF], abc.ABC):
 
     def start_services(
         self,
-        snap: Snap,
+        snap: "Snap",
         modified_tpl: typing.Sequence[template.Template],
         backend_tpls: typing.Sequence[template.Template],
     ) -> None:
         """Start the Cinder volume services."""
-        modified_files: set[Path] = set()
-        for tpl in modified_tpl:
-            modified_files.add(tpl.output_path())
-        backend_files: set[Path] = set()
-        for tpl in backend_tpls:
-            backend_files.add(tpl.output_path())
+        modified_files = {str(tpl.output_path()) for tpl in modified_tpl}
+        # backend files restart every service, no need to look further
+        backend_modified = not modified_files.isdisjoint(
+            str(tpl.output_path()) for tpl in backend_tpls
+        )
         snap_services = snap.services.list()
         for service in services.services():
             snap_service = snap_services.get(service.name)
             if not snap_service:
-                logging.warning("Service %s not found in snap services", service.name)
+                logger.warning("Service %s not found in snap services", service.name)
                 continue
 
-            common = modified_files.intersection(
-                set(service.configuration_files)
-                | set(service.restart_trigger_files)
-                | backend_files
-            )
-            if common:
-                logging.debug("Restarting service %s", service.name)
+            if backend_modified or not modified_files.isdisjoint(
+                _service_trigger_files(service)
+            ):
+                logger.debug("Restarting service %s", service.name)
                 snap_service.restart()
             else:
-                logging.debug("Starting service %s", service.name)
+                logger.debug("Starting service %s", service.name)
                 snap_service.start()
 
     @abc.abstractmethod
@@ -115,16 +320,21 @@ class CinderVolume(typing.Generic[CONF], abc.ABC):
         """Return the configuration type."""
         raise NotImplementedError
 
-    def get_config(self, snap: Snap) -> CONF:
-        """Get the configuration for the snap."""
-        logging.debug("Getting configuration")
-        keys = self.config_type().model_fields.keys()
-        all_config = snap.config.get_options(*keys).as_dict()
+    def get_config(self, snap: "Snap") -> CONF:
+        """Get the configuration for the snap.
 
-        try:
-            return self.config_type().model_validate(all_config)
-        except pydantic.ValidationError as e:
-            raise error.CinderError("Invalid configuration") from e
+        The configuration is read and validated once per instance.
+        """
+        if self._config is None:
+            logger.debug("Getting configuration")
+            keys = _config_field_names(self.config_type())
+            all_config = snap.config.get_options(*keys).as_dict()
+
+            try:
+                self._config = self.config_type().model_validate(all_config)
+            except pydantic.ValidationError as e:
+                raise error.CinderError("Invalid configuration") from e
+        return self._config
 
     def directories(self) -> list[template.Directory]:
         """Directories to be created on the common path."""
@@ -148,12 +358,18 @@ class CinderVolume(typing.Generic[CONF], abc.ABC):
             ),
         ]
 
+    def backend_contexts(self, snap: "Snap") -> context.CinderBackendContexts:
+        """Instanciated backend context, built once per instance."""
+        if self._backend_contexts is None:
+            self._backend_contexts = self._build_backend_contexts(snap)
+        return self._backend_contexts
+
     @abc.abstractmethod
-    def backend_contexts(self, snap: Snap) -> context.CinderBackendContexts:
-        """Instanciated backend context."""
+    def _build_backend_contexts(self, snap: "Snap") -> context.CinderBackendContexts:
+        """Instanciate the backend contexts."""
         raise NotImplementedError
 
-    def contexts(self, snap: Snap) -> typing.Sequence[context.Context]:
+    def contexts(self, snap: "Snap") -> typing.Sequence[context.Context]:
         """Contexts to be used in the templates."""
         if self._contexts is None:
             self._contexts = [
@@ -166,91 +382,99 @@ class CinderVolume(typing.Generic[CONF], abc.ABC):
         return self._contexts
 
     def render_context(
-        self, snap: Snap
+        self, snap: "Snap"
     ) -> typing.MutableMapping[str, typing.Mapping[str, str]]:
-        """Render the context for the snap."""
-        context = {}
-        for ctx in self.contexts(snap):
-            logging.debug("Adding context: %s", ctx.namespace)
-            context[ctx.namespace] = ctx.context()
-        return context
+        """Render the context for the snap.
+
+        The context is built once per instance, callers get a shallow copy
+        they are free to extend.
+        """
+        if self._render_context is None:
+            self._render_context = {
+                ctx.namespace: ctx.context() for ctx in self.contexts(snap)
+            }
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Added contexts: %s", ", ".join(self._render_context))
+        return dict(self._render_context)
 
     def setup_dirs(
-        self, snap: Snap, backend_contexts: context.CinderBackendContexts | None = None
+        self,
+        snap: "Snap",
+        backend_contexts: context.CinderBackendContexts | None = None,
     ) -> None:
         """Set up directories for the snap."""
         directories = self.directories()
         if backend_contexts:
-            for backend_context in backend_contexts.contexts.values():
-                directories.extend(backend_context.directories())
+            directories.extend(backend_contexts.all_directories())
 
+        # the same directory may be requested several times, the last
+        # requested mode wins as it would when applied sequentially
+        locations = _locations(snap)
+        modes: dict[Path, int] = {}
         for d in directories:
-            path: Path = getattr(snap.paths, d.location).joinpath(d.path)
-            logging.debug("Creating directory: %s", path)
-            path.mkdir(parents=True, exist_ok=True)
-            path.chmod(d.mode)
+            modes[locations[d.location] / d.path] = d.mode
 
-    def templates_search_path(self, snap: Snap) -> list[Path]:
-        """Get the search path for templates."""
+        debug = logger.isEnabledFor(logging.DEBUG)
+        for path, mode in modes.items():
+            if debug:
+                logger.debug("Creating directory: %s", path)
+            _ensure_directory(path, mode)
+
+    @classmethod
+    @functools.cache
+    def _class_templates_dir(cls) -> Path | None:
+        """Return the templates directory shipped next to the class, if any."""
         try:
-            extra = [Path(inspect.getfile(self.__class__)).parent / "templates"]
+            return Path(inspect.getfile(cls)).parent / "templates"
         except Exception:
-            logging.error("Failed to get templates path from class", exc_info=True)
-            extra = []
-        return [
-            snap.paths.common / "templates",
-            *extra,
-            Path(__file__).parent / "templates",
-        ]
+            logger.error("Failed to get templates path from class", exc_info=True)
+            return None
+
+    def templates_search_path(self, snap: "Snap") -> list[Path]:
+        """Get the search path for templates."""
+        return list(
+            _templates_search_path(snap.paths.common, self._class_templates_dir())
+        )
 
-    def _process_template(
+    def _render_template(
         self,
-        snap: Snap,
+        locations: typing.Mapping[str, Path],
         env: jinja2.Environment,
         template: template.Template,
         context: typing.Mapping[str, typing.Mapping[str, str]],
-    ) -> bool:
-        file_name = template.filename
-        dest_dir: Path = getattr(snap.paths, template.location) / template.dest
-        dest_dir.mkdir(parents=True, exist_ok=True)
-        dest_file = dest_dir / file_name.removesuffix(".j2")
-
-        original_hash = None
-        if dest_file.exists():
-            original_hash = hash(dest_file.read_text())
-
-        if template.conditionals:
-            if not all(cond(context) for cond in template.conditionals):
-                logging.debug(
-                    "Skipping template %s due to unmet conditionals", template.filename
-                )
-                if dest_file.exists():
-                    logging.debug("Removing existing file %s", dest_file)
-                    dest_file.unlink()
-                return False
+    ) -> _PendingWrite | None:
+        """Render a template, returning the write to perform if it changed."""
+        dest_file: Path = locations[template.location] / template.output_path()
+
+        if not template.should_render(context):
+            logger.debug(
+                "Skipping template %s due to unmet conditionals", template.filename
+            )
+            if dest_file.exists():
+                logger.debug("Removing existing file %s", dest_file)
+                dest_file.unlink()
+            return None
 
         tpl = None
         template_file = template.template()
         try:
             tpl = env.get_template(template_file)
         except jinja2.exceptions.TemplateNotFound:
-            logging.debug("Template %s not found, trying with .j2", template_file)
+            logger.debug("Template %s not found, trying with .j2", template_file)
             tpl = env.get_template(template_file + ".j2")
 
-        rendered = tpl.render(**context)
-        if len(rendered) > 0 and rendered[-1] != "\n":
+        payload = tpl.render(**context).encode()
+        if payload and not payload.endswith(b"\n"):
             # ensure trailing new line
-            rendered += "\n"
-
-        new_hash = hash(rendered)
+            payload += b"\n"
 
-        if original_hash == new_hash:
-            logging.debug("File %s has not changed, skipping", dest_file)
-            return False
-        logging.debug("File %s has changed, writing new content", dest_file)
-        dest_file.write_text(rendered)
-        dest_file.chmod(template.mode)
-        return True
+        if _file_matches(dest_file, payload):
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("File %s has not changed, skipping", dest_file)
+            return None
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("File %s has changed, writing new content", dest_file)
+        return dest_file, payload, template.mode
 
     def _render_specific_backend_configs(
         self,
@@ -258,56 +482,104 @@ class CinderVolume(typing.Generic[CONF], abc.ABC):
         value: typing.Any,
     ) -> typing.Any:
         """Allow to render backend values with jinja2 templates."""
-        if isinstance(value, str):
-            return jinja2.Template(value).render(**context)
-        elif isinstance(value, dict):
-            return {
-                k: self._render_specific_backend_configs(context, v)
-                for k, v in value.items()
-            }
-        return value
+        if not isinstance(value, dict):
+            return _render_value(value, context) if isinstance(value, str) else value
+
+        # walk nested dicts with an explicit stack, checking the exact type
+        # first as leaves are overwhelmingly plain str, int, bool or None
+        result: dict[str, typing.Any] = {}
+        stack = [(result, value)]
+        while stack:
+            target, source = stack.pop()
+            for k, v in source.items():
+                kind = type(v)
+                if kind is str:
+                    target[k] = _render_value(v, context)
+                elif kind in _LEAF_TYPES:
+                    target[k] = v
+                elif isinstance(v, dict):
+                    nested: dict[str, typing.Any] = {}
+                    target[k] = nested
+                    stack.append((nested, v))
+                elif isinstance(v, str):
+                    target[k] = _render_value(v, context)
+                else:
+                    target[k] = v
+        return result
 
-    def template(self, snap: Snap) -> list[template.Template]:
+    def template(
+        self,
+        snap: "Snap",
+        backend_contexts: context.CinderBackendContexts | None = None,
+    ) -> list[template.Template]:
         """Render templates for the Cinder volume service."""
-        env = jinja2.Environment(
-            loader=jinja2.FileSystemLoader(searchpath=self.templates_search_path(snap)),
-            keep_trailing_newline=True,
-            autoescape=jinja2.select_autoescape(),
-        )
-        env.globals.update(
-            {
-                "backend_ctx": context.backend_ctx,
-                "cinder_name": context.cinder_name,
-                "cinder_ctx": context.cinder_ctx,
-            }
-        )
+        env = _environment(self.templates_search_path(snap))
         modified_templates: list[template.Template] = []
         try:
             ctx = self.render_context(snap)
         except Exception as e:
-            logging.error("Failed to render context: %s", e)
+            logger.error("Failed to render context: %s", e)
             return modified_templates
-        backend_contexts = self.backend_contexts(snap)
+        if backend_contexts is None:
+            backend_contexts = self.backend_contexts(snap)
         ctx[backend_contexts.namespace] = self._render_specific_backend_configs(
             ctx, backend_contexts.context()
         )
+        locations = _locations(snap)
+        general_templates = self.template_files()
+        backend_templates = [
+            (backend_context, backend_context.template_files())
+            for backend_context in backend_contexts.contexts.values()
+        ]
+        # create every destination directory once, up-front
+        dest_dirs: set[Path] = {
+            locations[tpl.location] / tpl.dest for tpl in general_templates
+        }
+        for _, tpls in backend_templates:
+            dest_dirs.update(locations[tpl.location] / tpl.dest for tpl in tpls)
+        for dest_dir in dest_dirs:
+            _ensure_directory(dest_dir)
+        # changed files are only written once everything rendered
+        pending_writes: list[tuple[template.Template, _PendingWrite]] = []
         # process general templates
-        for tpl in self.template_files():
-            if self._process_template(snap, env, tpl, ctx):
-                modified_templates.append(tpl)
-        # process backend specific templates
-        for backend_context in backend_contexts.contexts.values():
-            ctx[context.BACKEND_CTX_KEY] = backend_context.context()
-            ctx[context.CINDER_CTX_KEY] = backend_context.backend_name  # type: ignore
-            for tpl in backend_context.template_files():
-                if self._process_template(snap, env, tpl, ctx):
-                    modified_templates.append(tpl)
-            ctx.pop(context.CINDER_CTX_KEY)
-            ctx.pop(context.BACKEND_CTX_KEY)
+        for tpl in general_templates:
+            if pending := self._render_template(locations, env, tpl, ctx):
+                pending_writes.append((tpl, pending))
+
+        # process backend specific templates, backends render to distinct
+        # files so they can be processed concurrently
+        def process_backend(
+            item: tuple[context.BaseBackendContext, list[template.Template]],
+        ) -> list[tuple[template.Template, _PendingWrite]]:
+            backend_context, tpls = item
+            backend_ctx: dict[str, typing.Any] = {
+                **ctx,
+                context.BACKEND_CTX_KEY: backend_context.cached_context(),
+                context.CINDER_CTX_KEY: backend_context.backend_name,
+            }
+            return [
+                (tpl, pending)
+                for tpl in tpls
+                if (pending := self._render_template(locations, env, tpl, backend_ctx))
+            ]
+
+        if len(backend_templates) > 1:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(_MAX_TEMPLATE_WORKERS, len(backend_templates))
+            ) as executor:
+                results = list(executor.map(process_backend, backend_templates))
+        else:
+            results = [process_backend(item) for item in backend_templates]
+        for backend_writes in results:
+            pending_writes.extend(backend_writes)
+
+        for tpl, pending in pending_writes:
+            _write_file(*pending)
+            modified_templates.append(tpl)
 
         return modified_templates
 
-    def _clear_backend_configs(self, snap: Snap) -> None:
+    def _clear_backend_configs(self, snap: "Snap") -> None:
         """Clear all existing backend configuration files.
 
         This ensures that when backends are removed from configuration,
@@ -321,10 +593,10 @@ class CinderVolume(typing.Generic[CONF], abc.ABC):
         # These are backend-specific configuration files
         for conf_file in backend_config_dir.glob("*.conf"):
             try:
-                logging.debug("Removing backend config file: %s", conf_file)
+                logger.debug("Removing backend config file: %s", conf_file)
                 conf_file.unlink()
             except OSError as e:
-                logging.warning(
+                logger.warning(
                     "Failed to remove backend config file %s: %s", conf_file, e
                 )
 
@@ -336,41 +608,41 @@ class GenericCinderVolume(CinderVolume[configuration.Configuration]):
         """Return the configuration type."""
         return configuration.Configuration
 
-    def backend_contexts(self, snap: Snap) -> context.CinderBackendContexts:
+    def _build_backend_contexts(self, snap: "Snap") -> context.CinderBackendContexts:
         """Instantiated backend context using fully dynamic discovery."""
-        if self._backend_contexts is None:
-            try:
-                cfg = self.get_config(snap)
-            except pydantic.ValidationError as e:
-                raise error.CinderError("Invalid configuration") from e
+        try:
+            cfg = self.get_config(snap)
+        except pydantic.ValidationError as e:
+            raise error.CinderError("Invalid configuration") from e
 
-            backend_ctxs: dict[str, context.BaseBackendContext] = {}
+        backend_ctxs: dict[str, context.BaseBackendContext] = {}
 
-            # Auto-discover all backend types from configuration
-            for field_name, field_info in self.config_type().model_fields.items():
-                # Skip non-backend fields
-                if not isinstance(getattr(cfg, field_name), dict):
-                    continue
+        # Auto-discover all backend types from configuration
+        for field_name, field_info in self.config_type().model_fields.items():
+            # Skip non-backend fields
+            if not isinstance(getattr(cfg, field_name), dict):
+                continue
 
-                # Get the context class name by convention: {Backend}BackendContext
-                context_class_name = f"{field_name.title()}BackendContext"
+            # Get the context class name by convention: {Backend}BackendContext
+            context_class_name = f"{field_name.title()}BackendContext"
 
-                # Get the context class from the context module
-                if hasattr(context, context_class_name):
-                    context_class = getattr(context, context_class_name)
-                    backend_configs = getattr(cfg, field_name)
+            # Get the context class from the context module
+            if hasattr(context, context_class_name):
+                context_class = getattr(context, context_class_name)
+                backend_configs = getattr(cfg, field_name)
 
-                    # Instantiate contexts for all backends of this type
-                    for name, be_cfg in backend_configs.items():
-                        backend_ctxs[name] = context_class(name, be_cfg.model_dump())
-                else:
-                    logging.warning(
-                        f"Context class {context_class_name} not"
-                        f" found for backend type {field_name}"
+                # Instantiate contexts for all backends of this type
+                for name, be_cfg in backend_configs.items():
+                    backend_ctxs[name] = context_class(
+                        name, _dump_backend_config(be_cfg)
                     )
+            else:
+                logger.warning(
+                    f"Context class {context_class_name} not"
+                    f" found for backend type {field_name}"
+                )
 
-            self._backend_contexts = context.CinderBackendContexts(
-                enabled_backends=list(backend_ctxs.keys()),
-                contexts=backend_ctxs,
-            )
-        return self._backend_contexts
+        return context.CinderBackendContexts(
+            enabled_backends=list(backend_ctxs.keys()),
+            contexts=backend_ctxs,
+        )
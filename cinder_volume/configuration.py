@@ -9,6 +9,8 @@ takes as input from `snap set`.
 
 import base64
 import binascii
+import functools
+import itertools
 import typing
 
 import pydantic
@@ -16,19 +18,48 @@ import pydantic.alias_generators
 from pydantic import Field, model_validator
 
 
+@functools.cache
 def to_kebab(value: str) -> str:
     """Convert a string to kebab-case."""
+    # lowercase letters and dashes are already kebab-case, digits are not
+    # as to_snake splits them from the preceding letter
+    if value.islower() and value.replace("-", "").isalpha():
+        return value
     return pydantic.alias_generators.to_snake(value).replace("_", "-")
 
 
+@functools.cache
+def _defined_fields(model: type[pydantic.BaseModel]) -> frozenset[str]:
+    """Return the names of the fields defined on a model."""
+    return frozenset(model.model_fields)
+
+
+# Storage protocols accepted by the backend drivers
+_FC_ISCSI = "^(fc|iscsi)$"
+_FC_ISCSI_NVME = "^(fc|iscsi|nvme)$"
+_ISCSI_NVME = "^(iscsi|nvme)$"
+
+_KEBAB_ALIAS_GENERATOR = pydantic.AliasGenerator(
+    validation_alias=to_kebab,
+    serialization_alias=to_kebab,
+)
+# Backend options are set in kebab-case but rendered in snake_case, extra
+# driver-specific options are allowed through
+_BACKEND_MODEL_CONFIG = pydantic.ConfigDict(
+    extra="allow",
+    alias_generator=pydantic.AliasGenerator(
+        validation_alias=to_kebab,
+        serialization_alias=pydantic.alias_generators.to_snake,
+    ),
+)
+
+
 class ParentConfig(pydantic.BaseModel):
     """Set common model configuration for all models."""
 
     model_config = pydantic.ConfigDict(
-        alias_generator=pydantic.AliasGenerator(
-            validation_alias=to_kebab,
-            serialization_alias=to_kebab,
-        ),
+        alias_generator=_KEBAB_ALIAS_GENERATOR,
+        frozen=True,
     )
 
 
@@ -103,9 +134,18 @@ class BaseBackendConfiguration(ParentConfig):
     def convert_extra_fields(cls, data):
         """Convert kebab-case keys to snake_case for extra fields."""
         if isinstance(data, dict):
+            defined_fields = _defined_fields(cls)
+            if not any(
+                "-" in key and key.replace("-", "_") not in defined_fields
+                for key in data
+            ):
+                # Nothing to rename, leave the input untouched
+                return data
             converted = {}
-            defined_fields = set(cls.model_fields.keys())
             for key, value in data.items():
+                if "-" not in key:
+                    converted[key] = value
+                    continue
                 snake_key = key.replace("-", "_")
                 if snake_key in defined_fields:
                     # Defined field - keep original key for alias generator
@@ -144,13 +184,7 @@ class HitachiConfiguration(BaseBackendConfiguration):
     Defaults follow the upstream driver recommendations/documentation.
     """
 
-    model_config = pydantic.ConfigDict(
-        extra="allow",  # Allow extra fields not defined in the model
-        alias_generator=pydantic.AliasGenerator(
-            validation_alias=to_kebab,
-            serialization_alias=pydantic.alias_generators.to_snake,
-        ),
-    )
+    model_config = _BACKEND_MODEL_CONFIG
 
     # Mandatory connection parameters
     san_ip: pydantic.IPvAnyAddress
@@ -160,7 +194,7 @@ class HitachiConfiguration(BaseBackendConfiguration):
     hitachi_pools: str  # comma‑separated list
 
     # Driver selection
-    protocol: str = Field(default="fc", pattern="^(fc|iscsi)$")
+    protocol: str = Field(default="fc", pattern=_FC_ISCSI)
 
 
 class PureConfiguration(BaseBackendConfiguration):
@@ -170,18 +204,12 @@ class PureConfiguration(BaseBackendConfiguration):
     with advanced features like replication, TriSync, and auto-eradication.
     """
 
-    model_config = pydantic.ConfigDict(
-        extra="allow",  # Allow extra fields not defined in the model
-        alias_generator=pydantic.AliasGenerator(
-            validation_alias=to_kebab,
-            serialization_alias=pydantic.alias_generators.to_snake,
-        ),
-    )
+    model_config = _BACKEND_MODEL_CONFIG
 
     # Core required fields
     san_ip: pydantic.IPvAnyAddress  # FlashArray management IP/FQDN
     pure_api_token: str  # REST API authorization token
-    protocol: str = Field(default="fc", pattern="^(iscsi|fc|nvme)$")
+    protocol: str = Field(default="fc", pattern=_FC_ISCSI_NVME)
 
 
 class DellSCConfiguration(BaseBackendConfiguration):
@@ -191,20 +219,14 @@ class DellSCConfiguration(BaseBackendConfiguration):
     with dual DSM support, network filtering, and comprehensive timeout controls.
     """
 
-    model_config = pydantic.ConfigDict(
-        extra="allow",  # Allow extra fields not defined in the model
-        alias_generator=pydantic.AliasGenerator(
-            validation_alias=to_kebab,
-            serialization_alias=pydantic.alias_generators.to_snake,
-        ),
-    )
+    model_config = _BACKEND_MODEL_CONFIG
 
     # Core required fields
     san_ip: pydantic.IPvAnyAddress  # Dell DSM management IP/FQDN
     san_login: str  # DSM management username
     san_password: str  # DSM management password
     dell_sc_ssn: int  # Storage Center System Serial Number
-    protocol: str = Field(default="fc", pattern="^(iscsi|fc)$")
+    protocol: str = Field(default="fc", pattern=_FC_ISCSI)
     enable_unsupported_driver: typing.Literal[True]
 
     # Optional secondary DSM settings
@@ -219,19 +241,13 @@ class DellpowerstoreConfiguration(BaseBackendConfiguration):
     This configuration supports iSCSI, Fibre Channel and NVMe-TCP protocols.
     """
 
-    model_config = pydantic.ConfigDict(
-        extra="allow",  # Allow extra fields not defined in the model
-        alias_generator=pydantic.AliasGenerator(
-            validation_alias=to_kebab,
-            serialization_alias=pydantic.alias_generators.to_snake,
-        ),
-    )
+    model_config = _BACKEND_MODEL_CONFIG
 
     # Core required fields
     san_ip: pydantic.IPvAnyAddress  # Dell PowerStore management IP/FQDN
     san_login: str  # Dell PowerStore management username
     san_password: str  # Dell PowerStore management password
-    protocol: str = Field(default="fc", pattern="^(iscsi|fc)$")
+    protocol: str = Field(default="fc", pattern=_FC_ISCSI)
 
 
 class HpethreeparConfiguration(BaseBackendConfiguration):
@@ -240,31 +256,19 @@ class HpethreeparConfiguration(BaseBackendConfiguration):
     This configuration supports iSCSI and Fibre Channel protocols.
     """
 
-    model_config = pydantic.ConfigDict(
-        extra="allow",  # Allow extra fields not defined in the model
-        alias_generator=pydantic.AliasGenerator(
-            validation_alias=to_kebab,
-            serialization_alias=pydantic.alias_generators.to_snake,
-        ),
-    )
+    model_config = _BACKEND_MODEL_CONFIG
 
     # Core required fields
     san_ip: pydantic.IPvAnyAddress  # HPE 3Par san controller IP
     san_login: str  # HPE 3Par san controller username
     san_password: str  # HPE 3Par san controller password
-    protocol: str = Field(default="fc", pattern="^(iscsi|fc)$")
+    protocol: str = Field(default="fc", pattern=_FC_ISCSI)
 
 
 class SolidfireConfiguration(BaseBackendConfiguration):
     """All options recognised by the **NetApp SolidFire** Cinder driver."""
 
-    model_config = pydantic.ConfigDict(
-        extra="allow",  # Allow driver-specific fields not listed here
-        alias_generator=pydantic.AliasGenerator(
-            validation_alias=to_kebab,
-            serialization_alias=pydantic.alias_generators.to_snake,
-        ),
-    )
+    model_config = _BACKEND_MODEL_CONFIG
 
     # Core required fields
     san_ip: pydantic.IPvAnyAddress  # IP address of SAN controller
@@ -275,13 +279,7 @@ class SolidfireConfiguration(BaseBackendConfiguration):
 class DatacoreConfiguration(BaseBackendConfiguration):
     """All options recognised by the **DataCoreVolume** Cinder driver."""
 
-    model_config = pydantic.ConfigDict(
-        extra="allow",  # Allow driver-specific fields not listed here
-        alias_generator=pydantic.AliasGenerator(
-            validation_alias=to_kebab,
-            serialization_alias=pydantic.alias_generators.to_snake,
-        ),
-    )
+    model_config = _BACKEND_MODEL_CONFIG
 
     # No additional required fields beyond BaseBackendConfiguration.
 
@@ -289,13 +287,7 @@ class DatacoreConfiguration(BaseBackendConfiguration):
 class DateraConfiguration(BaseBackendConfiguration):
     """All options recognised by the **Datera** Cinder driver."""
 
-    model_config = pydantic.ConfigDict(
-        extra="allow",  # Allow driver-specific fields not listed here
-        alias_generator=pydantic.AliasGenerator(
-            validation_alias=to_kebab,
-            serialization_alias=pydantic.alias_generators.to_snake,
-        ),
-    )
+    model_config = _BACKEND_MODEL_CONFIG
 
     # Core required fields
     san_ip: pydantic.IPvAnyAddress  # IP address of SAN controller
@@ -306,52 +298,34 @@ class DateraConfiguration(BaseBackendConfiguration):
 class DellpowermaxConfiguration(BaseBackendConfiguration):
     """All options recognised by the **Dell PowerMax** Cinder driver."""
 
-    model_config = pydantic.ConfigDict(
-        extra="allow",  # Allow driver-specific fields not listed here
-        alias_generator=pydantic.AliasGenerator(
-            validation_alias=to_kebab,
-            serialization_alias=pydantic.alias_generators.to_snake,
-        ),
-    )
+    model_config = _BACKEND_MODEL_CONFIG
 
     # Core required fields
     san_ip: pydantic.IPvAnyAddress  # IP address of SAN controller
     san_login: str  # Username for SAN controller
     san_password: str  # Password for SAN controller
-    protocol: str = Field(default="fc", pattern="^(fc|iscsi)$")
+    protocol: str = Field(default="fc", pattern=_FC_ISCSI)
 
 
 class DellpowervaultConfiguration(BaseBackendConfiguration):
     """All options recognised by the **Dell PowerVault** Cinder driver."""
 
-    model_config = pydantic.ConfigDict(
-        extra="allow",  # Allow driver-specific fields not listed here
-        alias_generator=pydantic.AliasGenerator(
-            validation_alias=to_kebab,
-            serialization_alias=pydantic.alias_generators.to_snake,
-        ),
-    )
+    model_config = _BACKEND_MODEL_CONFIG
 
     # Core required fields
-    protocol: str = Field(default="fc", pattern="^(fc|iscsi)$")
+    protocol: str = Field(default="fc", pattern=_FC_ISCSI)
 
 
 class DellxtremioConfiguration(BaseBackendConfiguration):
     """All options recognised by the **Dell XtremIO** Cinder driver."""
 
-    model_config = pydantic.ConfigDict(
-        extra="allow",  # Allow driver-specific fields not listed here
-        alias_generator=pydantic.AliasGenerator(
-            validation_alias=to_kebab,
-            serialization_alias=pydantic.alias_generators.to_snake,
-        ),
-    )
+    model_config = _BACKEND_MODEL_CONFIG
 
     # Core required fields
     san_ip: pydantic.IPvAnyAddress  # IP address of SAN controller
     san_login: str  # Username for SAN controller
     san_password: str  # Password for SAN controller
-    protocol: str = Field(default="iscsi", pattern="^(iscsi|fc)$")
+    protocol: str = Field(default="iscsi", pattern=_FC_ISCSI)
     enable_unsupported_driver: typing.Literal[True]
 
 
@@ -361,50 +335,32 @@ class DellunityConfiguration(BaseBackendConfiguration):
     This configuration supports iSCSI and Fibre Channel protocols.
     """
 
-    model_config = pydantic.ConfigDict(
-        extra="allow",  # Allow driver-specific fields not listed here
-        alias_generator=pydantic.AliasGenerator(
-            validation_alias=to_kebab,
-            serialization_alias=pydantic.alias_generators.to_snake,
-        ),
-    )
+    model_config = _BACKEND_MODEL_CONFIG
 
     # Core required fields
     san_ip: pydantic.IPvAnyAddress  # Dell Unity management IP/FQDN
     san_login: str  # Dell Unity management username
     san_password: str  # Dell Unity management password
-    protocol: str = Field(default="iscsi", pattern="^(iscsi|fc)$")
+    protocol: str = Field(default="iscsi", pattern=_FC_ISCSI)
 
 
 class FujitsueternusdxConfiguration(BaseBackendConfiguration):
     """All options recognised by the **FJDX FC** Cinder driver."""
 
-    model_config = pydantic.ConfigDict(
-        extra="allow",  # Allow driver-specific fields not listed here
-        alias_generator=pydantic.AliasGenerator(
-            validation_alias=to_kebab,
-            serialization_alias=pydantic.alias_generators.to_snake,
-        ),
-    )
+    model_config = _BACKEND_MODEL_CONFIG
 
     # Core required fields
     fujitsu_passwordless: str  # Use SSH key to connect to storage.
-    protocol: str = Field(default="fc", pattern="^(fc|iscsi)$")
+    protocol: str = Field(default="fc", pattern=_FC_ISCSI)
 
 
 class HpexpConfiguration(BaseBackendConfiguration):
     """All options recognised by the **HPE XP** Cinder driver."""
 
-    model_config = pydantic.ConfigDict(
-        extra="allow",  # Allow driver-specific fields not listed here
-        alias_generator=pydantic.AliasGenerator(
-            validation_alias=to_kebab,
-            serialization_alias=pydantic.alias_generators.to_snake,
-        ),
-    )
+    model_config = _BACKEND_MODEL_CONFIG
 
     # Core required fields
-    protocol: str = Field(default="fc", pattern="^(fc|iscsi)$")
+    protocol: str = Field(default="fc", pattern=_FC_ISCSI)
 
 
 class HuaweidoradoConfiguration(BaseBackendConfiguration):
@@ -413,32 +369,20 @@ class HuaweidoradoConfiguration(BaseBackendConfiguration):
     This configuration supports FC, iSCSI, and NVMe protocols.
     """
 
-    model_config = pydantic.ConfigDict(
-        extra="allow",  # Allow driver-specific fields not listed here
-        alias_generator=pydantic.AliasGenerator(
-            validation_alias=to_kebab,
-            serialization_alias=pydantic.alias_generators.to_snake,
-        ),
-    )
+    model_config = _BACKEND_MODEL_CONFIG
 
     # Core required fields
     san_address: str  # Management IP(s) of the Huawei storage array (comma-separated)
     san_user: str  # Huawei storage management username
     san_password: str  # Huawei storage management password
     storage_pool: str  # Storage pool name(s) on the array
-    protocol: str = Field(default="fc", pattern="^(fc|iscsi|nvme)$")
+    protocol: str = Field(default="fc", pattern=_FC_ISCSI_NVME)
 
 
 class IbmflashsystemcommonConfiguration(BaseBackendConfiguration):
     """All options recognised by the **Ibmflashsystemcommon** Cinder driver."""
 
-    model_config = pydantic.ConfigDict(
-        extra="allow",  # Allow driver-specific fields not listed here
-        alias_generator=pydantic.AliasGenerator(
-            validation_alias=to_kebab,
-            serialization_alias=pydantic.alias_generators.to_snake,
-        ),
-    )
+    model_config = _BACKEND_MODEL_CONFIG
 
     # Core required fields
     san_ip: pydantic.IPvAnyAddress  # IP address of SAN controller
@@ -450,13 +394,7 @@ class IbmflashsystemcommonConfiguration(BaseBackendConfiguration):
 class IbmflashsystemiscsiConfiguration(BaseBackendConfiguration):
     """All options recognised by the **FlashSystem iSCSI** Cinder driver."""
 
-    model_config = pydantic.ConfigDict(
-        extra="allow",  # Allow driver-specific fields not listed here
-        alias_generator=pydantic.AliasGenerator(
-            validation_alias=to_kebab,
-            serialization_alias=pydantic.alias_generators.to_snake,
-        ),
-    )
+    model_config = _BACKEND_MODEL_CONFIG
 
     # No additional required fields beyond BaseBackendConfiguration.
 
@@ -464,13 +402,7 @@ class IbmflashsystemiscsiConfiguration(BaseBackendConfiguration):
 class IbmgpfsConfiguration(BaseBackendConfiguration):
     """All options recognised by the **GPFS** Cinder driver."""
 
-    model_config = pydantic.ConfigDict(
-        extra="allow",  # Allow driver-specific fields not listed here
-        alias_generator=pydantic.AliasGenerator(
-            validation_alias=to_kebab,
-            serialization_alias=pydantic.alias_generators.to_snake,
-        ),
-    )
+    model_config = _BACKEND_MODEL_CONFIG
 
     # Core required fields
     gpfs_user_password: str  # Password for GPFS node user.
@@ -482,13 +414,7 @@ class IbmgpfsConfiguration(BaseBackendConfiguration):
 class IbmibmstorageConfiguration(BaseBackendConfiguration):
     """All options recognised by the **IBMStorage** Cinder driver."""
 
-    model_config = pydantic.ConfigDict(
-        extra="allow",  # Allow driver-specific fields not listed here
-        alias_generator=pydantic.AliasGenerator(
-            validation_alias=to_kebab,
-            serialization_alias=pydantic.alias_generators.to_snake,
-        ),
-    )
+    model_config = _BACKEND_MODEL_CONFIG
 
     # Core required fields
     san_ip: pydantic.IPvAnyAddress  # IP address of SAN controller
@@ -499,38 +425,26 @@ class IbmibmstorageConfiguration(BaseBackendConfiguration):
 class IbmstorwizesvcConfiguration(BaseBackendConfiguration):
     """All options recognised by the **StorwizeSVC FC** Cinder driver."""
 
-    model_config = pydantic.ConfigDict(
-        extra="allow",  # Allow driver-specific fields not listed here
-        alias_generator=pydantic.AliasGenerator(
-            validation_alias=to_kebab,
-            serialization_alias=pydantic.alias_generators.to_snake,
-        ),
-    )
+    model_config = _BACKEND_MODEL_CONFIG
 
     # Core required fields
     san_ip: pydantic.IPvAnyAddress  # IP address of SAN controller
     san_login: str  # Username for SAN controller
     san_password: str  # Password for SAN controller
-    protocol: str = Field(default="fc", pattern="^(fc|iscsi)$")
+    protocol: str = Field(default="fc", pattern=_FC_ISCSI)
 
 
 class InfinidatConfiguration(BaseBackendConfiguration):
     """All options recognised by the **INFINIDAT InfiniBox** Cinder driver."""
 
-    model_config = pydantic.ConfigDict(
-        extra="allow",  # Allow driver-specific fields not listed here
-        alias_generator=pydantic.AliasGenerator(
-            validation_alias=to_kebab,
-            serialization_alias=pydantic.alias_generators.to_snake,
-        ),
-    )
+    model_config = _BACKEND_MODEL_CONFIG
 
     # Core required fields
     san_ip: pydantic.IPvAnyAddress  # IP address of SAN controller
     san_login: str  # Username for SAN controller
     san_password: str  # Password for SAN controller
     infinidat_pool_name: str  # Pool name on InfiniBox
-    protocol: str = Field(default="iscsi", pattern="^(iscsi|fc)$")
+    protocol: str = Field(default="iscsi", pattern=_FC_ISCSI)
     infinidat_iscsi_netspaces: str | None = None  # iSCSI netspace names
 
     use_chap_auth: bool = True
@@ -554,13 +468,7 @@ class InfinidatConfiguration(BaseBackendConfiguration):
 class Inspuras13000Configuration(BaseBackendConfiguration):
     """All options recognised by the **AS13000** Cinder driver."""
 
-    model_config = pydantic.ConfigDict(
-        extra="allow",  # Allow driver-specific fields not listed here
-        alias_generator=pydantic.AliasGenerator(
-            validation_alias=to_kebab,
-            serialization_alias=pydantic.alias_generators.to_snake,
-        ),
-    )
+    model_config = _BACKEND_MODEL_CONFIG
 
     # Core required fields
     as_13000_token_available_time: (
@@ -574,31 +482,19 @@ class Inspuras13000Configuration(BaseBackendConfiguration):
 class InspurinstorageConfiguration(BaseBackendConfiguration):
     """All options recognised by the **InStorageMCS FC** Cinder driver."""
 
-    model_config = pydantic.ConfigDict(
-        extra="allow",  # Allow driver-specific fields not listed here
-        alias_generator=pydantic.AliasGenerator(
-            validation_alias=to_kebab,
-            serialization_alias=pydantic.alias_generators.to_snake,
-        ),
-    )
+    model_config = _BACKEND_MODEL_CONFIG
 
     # Core required fields
     san_ip: pydantic.IPvAnyAddress  # IP address of SAN controller
     san_login: str  # Username for SAN controller
     san_password: str  # Password for SAN controller
-    protocol: str = Field(default="fc", pattern="^(fc|iscsi)$")
+    protocol: str = Field(default="fc", pattern=_FC_ISCSI)
 
 
 class KaminarioConfiguration(BaseBackendConfiguration):
     """All options recognised by the **Kaminario iSCSI** Cinder driver."""
 
-    model_config = pydantic.ConfigDict(
-        extra="allow",  # Allow driver-specific fields not listed here
-        alias_generator=pydantic.AliasGenerator(
-            validation_alias=to_kebab,
-            serialization_alias=pydantic.alias_generators.to_snake,
-        ),
-    )
+    model_config = _BACKEND_MODEL_CONFIG
 
     # No additional required fields beyond BaseBackendConfiguration.
 
@@ -606,13 +502,7 @@ class KaminarioConfiguration(BaseBackendConfiguration):
 class LinstorConfiguration(BaseBackendConfiguration):
     """All options recognised by the **LinstorIscsi** Cinder driver."""
 
-    model_config = pydantic.ConfigDict(
-        extra="allow",  # Allow driver-specific fields not listed here
-        alias_generator=pydantic.AliasGenerator(
-            validation_alias=to_kebab,
-            serialization_alias=pydantic.alias_generators.to_snake,
-        ),
-    )
+    model_config = _BACKEND_MODEL_CONFIG
 
     # No additional required fields beyond BaseBackendConfiguration.
 
@@ -620,61 +510,37 @@ class LinstorConfiguration(BaseBackendConfiguration):
 class MacrosanConfiguration(BaseBackendConfiguration):
     """All options recognised by the **MacroSAN iSCSI** Cinder driver."""
 
-    model_config = pydantic.ConfigDict(
-        extra="allow",  # Allow driver-specific fields not listed here
-        alias_generator=pydantic.AliasGenerator(
-            validation_alias=to_kebab,
-            serialization_alias=pydantic.alias_generators.to_snake,
-        ),
-    )
+    model_config = _BACKEND_MODEL_CONFIG
 
     # Core required fields
     macrosan_sdas_password: str  # MacroSAN sdas devices' password
     macrosan_replication_password: str  # MacroSAN replication devices' password
-    protocol: str = Field(default="iscsi", pattern="^(iscsi|fc)$")
+    protocol: str = Field(default="iscsi", pattern=_FC_ISCSI)
 
 
 class NecvConfiguration(BaseBackendConfiguration):
     """All options recognised by the **VStorage FC** Cinder driver."""
 
-    model_config = pydantic.ConfigDict(
-        extra="allow",  # Allow driver-specific fields not listed here
-        alias_generator=pydantic.AliasGenerator(
-            validation_alias=to_kebab,
-            serialization_alias=pydantic.alias_generators.to_snake,
-        ),
-    )
+    model_config = _BACKEND_MODEL_CONFIG
 
     # Core required fields
-    protocol: str = Field(default="fc", pattern="^(fc|iscsi)$")
+    protocol: str = Field(default="fc", pattern=_FC_ISCSI)
 
 
 class NetappConfiguration(BaseBackendConfiguration):
     """All options recognised by the **NetApp ONTAP** Cinder driver."""
 
-    model_config = pydantic.ConfigDict(
-        extra="allow",  # Allow driver-specific fields not listed here
-        alias_generator=pydantic.AliasGenerator(
-            validation_alias=to_kebab,
-            serialization_alias=pydantic.alias_generators.to_snake,
-        ),
-    )
+    model_config = _BACKEND_MODEL_CONFIG
 
     # Core required fields
     netapp_ca_certificate_file: str  # Absolute path to the trusted CA certificate file.
-    protocol: str = Field(default="iscsi", pattern="^(iscsi|nvme)$")
+    protocol: str = Field(default="iscsi", pattern=_ISCSI_NVME)
 
 
 class NexentaConfiguration(BaseBackendConfiguration):
     """All options recognised by the **Nexenta iSCSI** Cinder driver."""
 
-    model_config = pydantic.ConfigDict(
-        extra="allow",  # Allow driver-specific fields not listed here
-        alias_generator=pydantic.AliasGenerator(
-            validation_alias=to_kebab,
-            serialization_alias=pydantic.alias_generators.to_snake,
-        ),
-    )
+    model_config = _BACKEND_MODEL_CONFIG
 
     # Core required fields
     nexenta_rest_password: str  # Password to connect to NexentaEdge.
@@ -683,31 +549,19 @@ class NexentaConfiguration(BaseBackendConfiguration):
 class NimbleConfiguration(BaseBackendConfiguration):
     """All options recognised by the **HPE Nimble Storage** Cinder driver."""
 
-    model_config = pydantic.ConfigDict(
-        extra="allow",  # Allow driver-specific fields not listed here
-        alias_generator=pydantic.AliasGenerator(
-            validation_alias=to_kebab,
-            serialization_alias=pydantic.alias_generators.to_snake,
-        ),
-    )
+    model_config = _BACKEND_MODEL_CONFIG
 
     # Core required fields
     san_ip: pydantic.IPvAnyAddress  # IP address of SAN controller
     san_login: str  # Username for SAN controller
     san_password: str  # Password for SAN controller
-    protocol: str = Field(default="iscsi", pattern="^(iscsi|fc)$")
+    protocol: str = Field(default="iscsi", pattern=_FC_ISCSI)
 
 
 class OpeneConfiguration(BaseBackendConfiguration):
     """All options recognised by the **Jovian iSCSI** Cinder driver."""
 
-    model_config = pydantic.ConfigDict(
-        extra="allow",  # Allow driver-specific fields not listed here
-        alias_generator=pydantic.AliasGenerator(
-            validation_alias=to_kebab,
-            serialization_alias=pydantic.alias_generators.to_snake,
-        ),
-    )
+    model_config = _BACKEND_MODEL_CONFIG
 
     # Core required fields
     chap_password_len: int  # Length of the random string for CHAP password.
@@ -716,29 +570,17 @@ class OpeneConfiguration(BaseBackendConfiguration):
 class ProphetstorConfiguration(BaseBackendConfiguration):
     """All options recognised by the **DPL FC** Cinder driver."""
 
-    model_config = pydantic.ConfigDict(
-        extra="allow",  # Allow driver-specific fields not listed here
-        alias_generator=pydantic.AliasGenerator(
-            validation_alias=to_kebab,
-            serialization_alias=pydantic.alias_generators.to_snake,
-        ),
-    )
+    model_config = _BACKEND_MODEL_CONFIG
 
     # Core required fields
-    protocol: str = Field(default="fc", pattern="^(fc|iscsi)$")
+    protocol: str = Field(default="fc", pattern=_FC_ISCSI)
     enable_unsupported_driver: typing.Literal[True]
 
 
 class QnapConfiguration(BaseBackendConfiguration):
     """All options recognised by the **QNAP Storage** Cinder driver."""
 
-    model_config = pydantic.ConfigDict(
-        extra="allow",  # Allow driver-specific fields not listed here
-        alias_generator=pydantic.AliasGenerator(
-            validation_alias=to_kebab,
-            serialization_alias=pydantic.alias_generators.to_snake,
-        ),
-    )
+    model_config = _BACKEND_MODEL_CONFIG
 
     # Core required fields
     san_ip: pydantic.IPvAnyAddress  # IP address of SAN controller
@@ -750,13 +592,7 @@ class QnapConfiguration(BaseBackendConfiguration):
 class SandstoneConfiguration(BaseBackendConfiguration):
     """All options recognised by the **Sds iSCSI** Cinder driver."""
 
-    model_config = pydantic.ConfigDict(
-        extra="allow",  # Allow driver-specific fields not listed here
-        alias_generator=pydantic.AliasGenerator(
-            validation_alias=to_kebab,
-            serialization_alias=pydantic.alias_generators.to_snake,
-        ),
-    )
+    model_config = _BACKEND_MODEL_CONFIG
 
     # No additional required fields beyond BaseBackendConfiguration.
 
@@ -764,13 +600,7 @@ class SandstoneConfiguration(BaseBackendConfiguration):
 class StxConfiguration(BaseBackendConfiguration):
     """All options recognised by the **Stx** Cinder driver."""
 
-    model_config = pydantic.ConfigDict(
-        extra="allow",  # Allow driver-specific fields not listed here
-        alias_generator=pydantic.AliasGenerator(
-            validation_alias=to_kebab,
-            serialization_alias=pydantic.alias_generators.to_snake,
-        ),
-    )
+    model_config = _BACKEND_MODEL_CONFIG
 
     # No additional required fields beyond BaseBackendConfiguration.
 
@@ -778,13 +608,7 @@ class StxConfiguration(BaseBackendConfiguration):
 class SynologyConfiguration(BaseBackendConfiguration):
     """All options recognised by the **Syno iSCSI** Cinder driver."""
 
-    model_config = pydantic.ConfigDict(
-        extra="allow",  # Allow driver-specific fields not listed here
-        alias_generator=pydantic.AliasGenerator(
-            validation_alias=to_kebab,
-            serialization_alias=pydantic.alias_generators.to_snake,
-        ),
-    )
+    model_config = _BACKEND_MODEL_CONFIG
 
     # Core required fields
     synology_password: str  # Password of administrator for logging in Synology storage.
@@ -796,31 +620,19 @@ class SynologyConfiguration(BaseBackendConfiguration):
 class Toyouacs5000Configuration(BaseBackendConfiguration):
     """All options recognised by the **Acs5000 FC** Cinder driver."""
 
-    model_config = pydantic.ConfigDict(
-        extra="allow",  # Allow driver-specific fields not listed here
-        alias_generator=pydantic.AliasGenerator(
-            validation_alias=to_kebab,
-            serialization_alias=pydantic.alias_generators.to_snake,
-        ),
-    )
+    model_config = _BACKEND_MODEL_CONFIG
 
     # Core required fields
     san_ip: pydantic.IPvAnyAddress  # IP address of SAN controller
     san_login: str  # Username for SAN controller
     san_password: str  # Password for SAN controller
-    protocol: str = Field(default="fc", pattern="^(fc|iscsi)$")
+    protocol: str = Field(default="fc", pattern=_FC_ISCSI)
 
 
 class VeritasaccessConfiguration(BaseBackendConfiguration):
     """All options recognised by the **ACCESSIscsi** Cinder driver."""
 
-    model_config = pydantic.ConfigDict(
-        extra="allow",  # Allow driver-specific fields not listed here
-        alias_generator=pydantic.AliasGenerator(
-            validation_alias=to_kebab,
-            serialization_alias=pydantic.alias_generators.to_snake,
-        ),
-    )
+    model_config = _BACKEND_MODEL_CONFIG
 
     # Core required fields
     enable_unsupported_driver: typing.Literal[True]
@@ -829,28 +641,16 @@ class VeritasaccessConfiguration(BaseBackendConfiguration):
 class YadroConfiguration(BaseBackendConfiguration):
     """All options recognised by the **Tatlin FCVolume** Cinder driver."""
 
-    model_config = pydantic.ConfigDict(
-        extra="allow",  # Allow driver-specific fields not listed here
-        alias_generator=pydantic.AliasGenerator(
-            validation_alias=to_kebab,
-            serialization_alias=pydantic.alias_generators.to_snake,
-        ),
-    )
+    model_config = _BACKEND_MODEL_CONFIG
 
     # Core required fields
-    protocol: str = Field(default="fc", pattern="^(fc|iscsi)$")
+    protocol: str = Field(default="fc", pattern=_FC_ISCSI)
 
 
 class ZadaraConfiguration(BaseBackendConfiguration):
     """All options recognised by the **ZadaraVPSA iSCSI** Cinder driver."""
 
-    model_config = pydantic.ConfigDict(
-        extra="allow",  # Allow driver-specific fields not listed here
-        alias_generator=pydantic.AliasGenerator(
-            validation_alias=to_kebab,
-            serialization_alias=pydantic.alias_generators.to_snake,
-        ),
-    )
+    model_config = _BACKEND_MODEL_CONFIG
 
     # Core required fields
     zadara_access_key: str  # VPSA access key
@@ -873,24 +673,37 @@ class Configuration(BaseConfiguration):
     huaweidorado: dict[str, HuaweidoradoConfiguration] = {}
     infinidat: dict[str, InfinidatConfiguration] = {}
 
+    # Backend types whose names must be unique across each other
+    _UNIQUE_NAME_BACKENDS: typing.ClassVar[tuple[str, ...]] = (
+        "ceph",
+        "hitachi",
+        "pure",
+        "dellsc",
+        "dellunity",
+        "hpethreepar",
+        "huaweidorado",
+        "infinidat",
+    )
+
     @pydantic.model_validator(mode="after")
     def validate_unique_backend_names(self):
         """Validate that all backend names are unique across all backend types."""
+        names = [
+            backend.volume_backend_name
+            for backend in itertools.chain.from_iterable(
+                getattr(self, backend_type).values()
+                for backend_type in self._UNIQUE_NAME_BACKENDS
+            )
+        ]
+        pools = [backend.rbd_pool for backend in self.ceph.values()]
+        if len(set(names)) == len(names) and len(set(pools)) == len(pools):
+            return self
+
+        # Locate the first duplicate to report it
         backend_names = set()
         ceph_pools = set()
-
-        # Check all backend types for unique backend names
-        for backend_type, backends in [
-            ("ceph", self.ceph),
-            ("hitachi", self.hitachi),
-            ("pure", self.pure),
-            ("dellsc", self.dellsc),
-            ("dellunity", self.dellunity),
-            ("hpethreepar", self.hpethreepar),
-            ("huaweidorado", self.huaweidorado),
-            ("infinidat", self.infinidat),
-        ]:
-            for backend_key, backend in backends.items():
+        for backend_type in self._UNIQUE_NAME_BACKENDS:
+            for backend_key, backend in getattr(self, backend_type).items():
                 # Check for duplicate backend names across all types
                 if backend.volume_backend_name in backend_names:
                     raise ValueError(
@@ -900,7 +713,7 @@ class Configuration(BaseConfiguration):
                 backend_names.add(backend.volume_backend_name)
 
                 # Check for duplicate Ceph pools (only applies to Ceph backends)
-                if backend_type == "ceph" and hasattr(backend, "rbd_pool"):
+                if backend_type == "ceph":
                     if backend.rbd_pool in ceph_pools:
                         raise ValueError(
                             f"Duplicate Ceph pool '{backend.rbd_pool}' "
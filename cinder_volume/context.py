@@ -3,23 +3,28 @@
 
 """Context module for rendering configuration and templates."""
 
-import abc
 import collections.abc
+import functools
+import operator
 import pathlib
+import sys
 import typing
 
 import jinja2
-from snaphelpers import Snap
 
 from . import error, template
 
+if typing.TYPE_CHECKING:
+    from snaphelpers import Snap
 
-class Context(abc.ABC):
-    """Abstract base class for context providers."""
+
+class Context:
+    """Base class for context providers."""
+
+    __slots__ = ()
 
     namespace: str
 
-    @abc.abstractmethod
     def context(self) -> typing.Mapping[str, typing.Any]:
         """Return the context dictionary."""
         raise NotImplementedError
@@ -28,6 +33,8 @@ class Context(abc.ABC):
 class ConfigContext(Context):
     """Context provider for configuration data."""
 
+    __slots__ = ("namespace", "config")
+
     def __init__(self, namespace: str, config: typing.Mapping[str, typing.Any]):
         """Initialize with namespace and config."""
         self.namespace = namespace
@@ -41,17 +48,28 @@ class ConfigContext(Context):
 class SnapPathContext(Context):
     """Context provider for snap paths."""
 
+    __slots__ = ("snap", "_paths")
+
     namespace = "snap_paths"
 
-    def __init__(self, snap: Snap):
+    def __init__(self, snap: "Snap"):
         """Initialize with snap instance."""
         self.snap = snap
+        self._paths: typing.Mapping[str, typing.Any] | None = None
 
     def context(self) -> typing.Mapping[str, typing.Any]:
-        """Return snap paths as context."""
-        return {
-            name: getattr(self.snap.paths, name) for name in self.snap.paths.__slots__
-        }
+        """Return snap paths as context.
+
+        Snap paths do not change for the lifetime of the process, they are
+        read once.
+        """
+        if self._paths is None:
+            names = tuple(self.snap.paths.__slots__)
+            values = operator.attrgetter(*names)(self.snap.paths) if names else ()
+            if len(names) == 1:
+                values = (values,)
+            self._paths = dict(zip(names, values))
+        return self._paths
 
 
 ETC_CINDER_D_CONF_DIR = pathlib.Path("etc/cinder/cinder.conf.d")
@@ -104,20 +122,53 @@ def ca_bundle_set(config: template.ContextType) -> bool:
 class BaseBackendContext(Context):
     """Base class for backend context providers."""
 
+    __slots__ = (
+        "namespace",
+        "backend_name",
+        "backend_config",
+        "supports_cluster",
+        "_ctx",
+        "_template_files",
+        "_directories",
+    )
+
     _hidden_keys: typing.Sequence[str] = ("driver_ssl_cert",)
 
     def __init__(self, backend_name: str, backend_config: dict[str, typing.Any]):
         """Initialize with backend name and config."""
+        # the name is used as a key in every context lookup while rendering
+        backend_name = sys.intern(backend_name)
         self.namespace = backend_name
         self.backend_name = backend_name
         self.backend_config = backend_config
         self.supports_cluster = True
+        self._ctx: typing.Mapping[str, typing.Any] | None = None
+        self._template_files: list[template.Template] = [
+            template.CommonTemplate(
+                f"{backend_name}.conf",
+                ETC_CINDER_D_CONF_DIR,
+                template_name="backend.conf.j2",
+            ),
+            template.CommonTemplate(
+                f"{backend_name}.pem",
+                ETC_CINDER_D_CONF_DIR,
+                template_name="backend.pem.j2",
+                conditionals=[
+                    backend_variable_set(
+                        backend_name,
+                        "driver_ssl_cert_path",
+                    )
+                ],
+            ),
+        ]
+        self._directories: list[template.Directory] = []
 
-    def context(self) -> typing.Mapping[str, typing.Any]:
+    def context(self) -> dict[str, typing.Any]:
         """Full context for the backend configuration.
 
         This value is always associated to `namespace`, not
-        necessarily associated with `backend_name`.
+        necessarily associated with `backend_name`. A new dict is
+        returned on every call, subclasses extend it in place.
         """
         context = dict(self.backend_config)
         if context.get("driver_ssl_cert"):
@@ -129,6 +180,12 @@ class BaseBackendContext(Context):
             context["driver_ssl_cert_verify"] = True
         return context
 
+    def cached_context(self) -> typing.Mapping[str, typing.Any]:
+        """Return the backend context, computed once per instance."""
+        if self._ctx is None:
+            self._ctx = self.context()
+        return self._ctx
+
     @property
     def hidden_keys(self) -> collections.abc.Generator[str]:
         """Keys that should not be exposed in cinder context."""
@@ -136,43 +193,39 @@ class BaseBackendContext(Context):
             if issubclass(klass, BaseBackendContext):
                 yield from klass._hidden_keys
 
+    @classmethod
+    @functools.cache
+    def _hidden_key_set(cls) -> frozenset[str]:
+        """Hidden keys of the class and its bases."""
+        return frozenset(
+            key
+            for klass in cls.mro()
+            if issubclass(klass, BaseBackendContext)
+            for key in klass._hidden_keys
+        )
+
     def cinder_context(self) -> typing.Mapping[str, typing.Any]:
         """Context specific for cinder configuration.
 
         This value is always associated to `backend_name`, not
         necessarily associated with `namespace`.
         """
-        context = dict(self.context())
-        for key in self.hidden_keys:
-            context.pop(key, None)
-        return {k: v for k, v in context.items() if v is not None}
+        hidden = self._hidden_key_set()
+        return {
+            k: v
+            for k, v in self.cached_context().items()
+            if v is not None and k not in hidden
+        }
 
     def template_files(self) -> list[template.Template]:
         """Files to be templated."""
-        return [
-            template.CommonTemplate(
-                f"{self.backend_name}.conf",
-                ETC_CINDER_D_CONF_DIR,
-                template_name="backend.conf.j2",
-            ),
-            template.CommonTemplate(
-                f"{self.backend_name}.pem",
-                ETC_CINDER_D_CONF_DIR,
-                template_name="backend.pem.j2",
-                conditionals=[
-                    backend_variable_set(
-                        self.backend_name,
-                        "driver_ssl_cert_path",
-                    )
-                ],
-            ),
-        ]
+        return self._template_files
 
     def directories(self) -> list[template.Directory]:
         """Directories to be created."""
-        return []
+        return self._directories
 
-    def setup(self, snap: Snap):
+    def setup(self, snap: "Snap"):
         """Perform all actions needed to setup the backend."""
         pass
 
@@ -180,6 +233,8 @@ class BaseBackendContext(Context):
 class SolidfireBackendContext(BaseBackendContext):
     """Render a NetApp SolidFire backend stanza."""
 
+    __slots__ = ()
+
     def __init__(self, backend_name: str, backend_config: dict):
         """Initialize with backend name and config."""
         super().__init__(backend_name, backend_config)
@@ -187,7 +242,7 @@ class SolidfireBackendContext(BaseBackendContext):
 
     def context(self) -> dict:
         """Return context for NetApp SolidFire backend."""
-        context = dict(super().context())
+        context = super().context()
         context["volume_driver"] = "cinder.volume.drivers.solidfire.SolidFireDriver"
         return context
 
@@ -195,6 +250,8 @@ class SolidfireBackendContext(BaseBackendContext):
 class DatacoreBackendContext(BaseBackendContext):
     """Render a DataCoreVolume backend stanza."""
 
+    __slots__ = ()
+
     def __init__(self, backend_name: str, backend_config: dict):
         """Initialize with backend name and config."""
         super().__init__(backend_name, backend_config)
@@ -202,7 +259,7 @@ class DatacoreBackendContext(BaseBackendContext):
 
     def context(self) -> dict:
         """Return context for DataCoreVolume backend."""
-        context = dict(super().context())
+        context = super().context()
         context["volume_driver"] = (
             "cinder.volume.drivers.datacore.fc.FibreChannelVolumeDriver"
         )
@@ -212,6 +269,8 @@ class DatacoreBackendContext(BaseBackendContext):
 class DateraBackendContext(BaseBackendContext):
     """Render a Datera backend stanza."""
 
+    __slots__ = ()
+
     def __init__(self, backend_name: str, backend_config: dict):
         """Initialize with backend name and config."""
         super().__init__(backend_name, backend_config)
@@ -219,7 +278,7 @@ class DateraBackendContext(BaseBackendContext):
 
     def context(self) -> dict:
         """Return context for Datera backend."""
-        context = dict(super().context())
+        context = super().context()
         context["volume_driver"] = (
             "cinder.volume.drivers.datera.datera_iscsi.DateraDriver"
         )
@@ -229,7 +288,13 @@ class DateraBackendContext(BaseBackendContext):
 class DellpowermaxBackendContext(BaseBackendContext):
     """Render a Dell PowerMax backend stanza."""
 
+    __slots__ = ()
+
     _hidden_keys = ("protocol",)
+    _driver_classes: typing.ClassVar[dict[str, str]] = {
+        "fc": "cinder.volume.drivers.dell_emc.powermax.fc.PowerMaxFCDriver",
+        "iscsi": "cinder.volume.drivers.dell_emc.powermax.iscsi.PowerMaxISCSIDriver",
+    }
 
     def __init__(self, backend_name: str, backend_config: dict):
         """Initialize with backend name and config."""
@@ -238,17 +303,10 @@ class DellpowermaxBackendContext(BaseBackendContext):
 
     def context(self) -> dict:
         """Return context for Dell PowerMax backend."""
-        context = dict(super().context())
+        context = super().context()
         protocol = self.backend_config.get("protocol", "fc").lower()
 
-        driver_classes = {
-            "fc": "cinder.volume.drivers.dell_emc.powermax.fc.PowerMaxFCDriver",
-            "iscsi": (
-                "cinder.volume.drivers.dell_emc.powermax.iscsi.PowerMaxISCSIDriver"
-            ),
-        }
-
-        driver_class = driver_classes.get(protocol, driver_classes["fc"])
+        driver_class = self._driver_classes.get(protocol, self._driver_classes["fc"])
         context.update({"volume_driver": driver_class})
         return context
 
@@ -256,7 +314,13 @@ class DellpowermaxBackendContext(BaseBackendContext):
 class DellpowervaultBackendContext(BaseBackendContext):
     """Render a Dell PowerVault backend stanza."""
 
+    __slots__ = ()
+
     _hidden_keys = ("protocol",)
+    _driver_classes: typing.ClassVar[dict[str, str]] = {
+        "fc": "cinder.volume.drivers.dell_emc.powervault.fc.PVMEFCDriver",
+        "iscsi": "cinder.volume.drivers.dell_emc.powervault.iscsi.PVMEISCSIDriver",
+    }
 
     def __init__(self, backend_name: str, backend_config: dict):
         """Initialize with backend name and config."""
@@ -265,15 +329,10 @@ class DellpowervaultBackendContext(BaseBackendContext):
 
     def context(self) -> dict:
         """Return context for Dell PowerVault backend."""
-        context = dict(super().context())
+        context = super().context()
         protocol = self.backend_config.get("protocol", "fc").lower()
 
-        driver_classes = {
-            "fc": "cinder.volume.drivers.dell_emc.powervault.fc.PVMEFCDriver",
-            "iscsi": "cinder.volume.drivers.dell_emc.powervault.iscsi.PVMEISCSIDriver",
-        }
-
-        driver_class = driver_classes.get(protocol, driver_classes["fc"])
+        driver_class = self._driver_classes.get(protocol, self._driver_classes["fc"])
         context.update({"volume_driver": driver_class})
         return context
 
@@ -281,7 +340,13 @@ class DellpowervaultBackendContext(BaseBackendContext):
 class DellxtremioBackendContext(BaseBackendContext):
     """Render a Dell XtremIO backend stanza."""
 
+    __slots__ = ()
+
     _hidden_keys = ("protocol",)
+    _driver_classes: typing.ClassVar[dict[str, str]] = {
+        "iscsi": "cinder.volume.drivers.dell_emc.xtremio.XtremIOISCSIDriver",
+        "fc": "cinder.volume.drivers.dell_emc.xtremio.XtremIOFCDriver",
+    }
 
     def __init__(self, backend_name: str, backend_config: dict):
         """Initialize with backend name and config."""
@@ -290,15 +355,10 @@ class DellxtremioBackendContext(BaseBackendContext):
 
     def context(self) -> dict:
         """Return context for Dell XtremIO backend."""
-        context = dict(super().context())
+        context = super().context()
         protocol = self.backend_config.get("protocol", "iscsi").lower()
 
-        driver_classes = {
-            "iscsi": "cinder.volume.drivers.dell_emc.xtremio.XtremIOISCSIDriver",
-            "fc": "cinder.volume.drivers.dell_emc.xtremio.XtremIOFCDriver",
-        }
-
-        driver_class = driver_classes.get(protocol, driver_classes["iscsi"])
+        driver_class = self._driver_classes.get(protocol, self._driver_classes["iscsi"])
         context.update({"volume_driver": driver_class})
         return context
 
@@ -306,6 +366,8 @@ class DellxtremioBackendContext(BaseBackendContext):
 class DellunityBackendContext(BaseBackendContext):
     """Render a Dell Unity backend stanza."""
 
+    __slots__ = ()
+
     _hidden_keys = ("protocol",)
 
     def __init__(self, backend_name: str, backend_config: dict):
@@ -315,7 +377,7 @@ class DellunityBackendContext(BaseBackendContext):
 
     def context(self) -> dict:
         """Return context for Dell Unity backend."""
-        context = dict(super().context())
+        context = super().context()
 
         # Note that the class doesn't change across the configured protocols
         unity_driver = "cinder.volume.drivers.dell_emc.unity.driver.UnityDriver"
@@ -333,7 +395,15 @@ class DellunityBackendContext(BaseBackendContext):
 class FujitsueternusdxBackendContext(BaseBackendContext):
     """Render a FJDX FC backend stanza."""
 
+    __slots__ = ()
+
     _hidden_keys = ("protocol",)
+    _driver_classes: typing.ClassVar[dict[str, str]] = {
+        "fc": "cinder.volume.drivers.fujitsu.eternus_dx.eternus_dx_fc.FJDXFCDriver",
+        "iscsi": (
+            "cinder.volume.drivers.fujitsu.eternus_dx.eternus_dx_iscsi.FJDXISCSIDriver"
+        ),
+    }
 
     def __init__(self, backend_name: str, backend_config: dict):
         """Initialize with backend name and config."""
@@ -342,20 +412,10 @@ class FujitsueternusdxBackendContext(BaseBackendContext):
 
     def context(self) -> dict:
         """Return context for FJDX FC backend."""
-        context = dict(super().context())
+        context = super().context()
         protocol = self.backend_config.get("protocol", "fc").lower()
 
-        driver_classes = {
-            "fc": (
-                "cinder.volume.drivers.fujitsu.eternus_dx.eternus_dx_fc.FJDXFCDriver"
-            ),
-            "iscsi": (
-                "cinder.volume.drivers.fujitsu.eternus_dx.eternus_dx_iscsi"
-                ".FJDXISCSIDriver"
-            ),
-        }
-
-        driver_class = driver_classes.get(protocol, driver_classes["fc"])
+        driver_class = self._driver_classes.get(protocol, self._driver_classes["fc"])
         context.update({"volume_driver": driver_class})
         return context
 
@@ -363,7 +423,13 @@ class FujitsueternusdxBackendContext(BaseBackendContext):
 class HpexpBackendContext(BaseBackendContext):
     """Render a HPE XP backend stanza."""
 
+    __slots__ = ()
+
     _hidden_keys = ("protocol",)
+    _driver_classes: typing.ClassVar[dict[str, str]] = {
+        "fc": "cinder.volume.drivers.hpe.xp.hpe_xp_fc.HPEXPFCDriver",
+        "iscsi": "cinder.volume.drivers.hpe.xp.hpe_xp_iscsi.HPEXPISCSIDriver",
+    }
 
     def __init__(self, backend_name: str, backend_config: dict):
         """Initialize with backend name and config."""
@@ -372,15 +438,10 @@ class HpexpBackendContext(BaseBackendContext):
 
     def context(self) -> dict:
         """Return context for HPE XP backend."""
-        context = dict(super().context())
+        context = super().context()
         protocol = self.backend_config.get("protocol", "fc").lower()
 
-        driver_classes = {
-            "fc": "cinder.volume.drivers.hpe.xp.hpe_xp_fc.HPEXPFCDriver",
-            "iscsi": "cinder.volume.drivers.hpe.xp.hpe_xp_iscsi.HPEXPISCSIDriver",
-        }
-
-        driver_class = driver_classes.get(protocol, driver_classes["fc"])
+        driver_class = self._driver_classes.get(protocol, self._driver_classes["fc"])
         context.update({"volume_driver": driver_class})
         return context
 
@@ -388,7 +449,14 @@ class HpexpBackendContext(BaseBackendContext):
 class HuaweidoradoBackendContext(BaseBackendContext):
     """Render a Huawei OceanStor Dorado backend stanza."""
 
+    __slots__ = ()
+
     _hidden_keys = ("protocol",)
+    _driver_classes: typing.ClassVar[dict[str, str]] = {
+        "fc": "cinder.volume.drivers.huawei.huawei_driver.HuaweiFCDriver",
+        "iscsi": "cinder.volume.drivers.huawei.huawei_driver.HuaweiISCSIDriver",
+        "nvme": "cinder.volume.drivers.huawei.huawei_driver.HuaweiNVMeDriver",
+    }
 
     def __init__(self, backend_name: str, backend_config: dict):
         """Initialize with backend name and config."""
@@ -397,16 +465,10 @@ class HuaweidoradoBackendContext(BaseBackendContext):
 
     def context(self) -> dict:
         """Return context for Huawei OceanStor Dorado backend."""
-        context = dict(super().context())
+        context = super().context()
         protocol = self.backend_config.get("protocol", "fc").lower()
 
-        driver_classes = {
-            "fc": "cinder.volume.drivers.huawei.huawei_driver.HuaweiFCDriver",
-            "iscsi": "cinder.volume.drivers.huawei.huawei_driver.HuaweiISCSIDriver",
-            "nvme": "cinder.volume.drivers.huawei.huawei_driver.HuaweiNVMeDriver",
-        }
-
-        driver_class = driver_classes.get(protocol, driver_classes["fc"])
+        driver_class = self._driver_classes.get(protocol, self._driver_classes["fc"])
         context.update({"volume_driver": driver_class})
         return context
 
@@ -414,6 +476,8 @@ class HuaweidoradoBackendContext(BaseBackendContext):
 class IbmflashsystemcommonBackendContext(BaseBackendContext):
     """Render a Ibmflashsystemcommon backend stanza."""
 
+    __slots__ = ()
+
     def __init__(self, backend_name: str, backend_config: dict):
         """Initialize with backend name and config."""
         super().__init__(backend_name, backend_config)
@@ -421,7 +485,7 @@ class IbmflashsystemcommonBackendContext(BaseBackendContext):
 
     def context(self) -> dict:
         """Return context for Ibmflashsystemcommon backend."""
-        context = dict(super().context())
+        context = super().context()
         context["volume_driver"] = (
             "cinder.volume.drivers.ibm.flashsystem_common.FlashSystemDriver"
         )
@@ -431,6 +495,8 @@ class IbmflashsystemcommonBackendContext(BaseBackendContext):
 class IbmflashsystemiscsiBackendContext(BaseBackendContext):
     """Render a FlashSystem iSCSI backend stanza."""
 
+    __slots__ = ()
+
     def __init__(self, backend_name: str, backend_config: dict):
         """Initialize with backend name and config."""
         super().__init__(backend_name, backend_config)
@@ -438,7 +504,7 @@ class IbmflashsystemiscsiBackendContext(BaseBackendContext):
 
     def context(self) -> dict:
         """Return context for FlashSystem iSCSI backend."""
-        context = dict(super().context())
+        context = super().context()
         context["volume_driver"] = (
             "cinder.volume.drivers.ibm.flashsystem_iscsi.FlashSystemISCSIDriver"
         )
@@ -448,6 +514,8 @@ class IbmflashsystemiscsiBackendContext(BaseBackendContext):
 class IbmgpfsBackendContext(BaseBackendContext):
     """Render a GPFS backend stanza."""
 
+    __slots__ = ()
+
     def __init__(self, backend_name: str, backend_config: dict):
         """Initialize with backend name and config."""
         super().__init__(backend_name, backend_config)
@@ -455,7 +523,7 @@ class IbmgpfsBackendContext(BaseBackendContext):
 
     def context(self) -> dict:
         """Return context for GPFS backend."""
-        context = dict(super().context())
+        context = super().context()
         context["volume_driver"] = "cinder.volume.drivers.ibm.gpfs.GPFSDriver"
         return context
 
@@ -463,6 +531,8 @@ class IbmgpfsBackendContext(BaseBackendContext):
 class IbmibmstorageBackendContext(BaseBackendContext):
     """Render a IBMStorage backend stanza."""
 
+    __slots__ = ()
+
     def __init__(self, backend_name: str, backend_config: dict):
         """Initialize with backend name and config."""
         super().__init__(backend_name, backend_config)
@@ -470,7 +540,7 @@ class IbmibmstorageBackendContext(BaseBackendContext):
 
     def context(self) -> dict:
         """Return context for IBMStorage backend."""
-        context = dict(super().context())
+        context = super().context()
         context["volume_driver"] = (
             "cinder.volume.drivers.ibm.ibm_storage.ibm_storage.IBMStorageDriver"
         )
@@ -480,7 +550,18 @@ class IbmibmstorageBackendContext(BaseBackendContext):
 class IbmstorwizesvcBackendContext(BaseBackendContext):
     """Render a StorwizeSVC FC backend stanza."""
 
+    __slots__ = ()
+
     _hidden_keys = ("protocol",)
+    _driver_classes: typing.ClassVar[dict[str, str]] = {
+        "fc": (
+            "cinder.volume.drivers.ibm.storwize_svc.storwize_svc_fc.StorwizeSVCFCDriver"
+        ),
+        "iscsi": (
+            "cinder.volume.drivers.ibm.storwize_svc.storwize_svc_iscsi"
+            ".StorwizeSVCISCSIDriver"
+        ),
+    }
 
     def __init__(self, backend_name: str, backend_config: dict):
         """Initialize with backend name and config."""
@@ -489,21 +570,10 @@ class IbmstorwizesvcBackendContext(BaseBackendContext):
 
     def context(self) -> dict:
         """Return context for StorwizeSVC FC backend."""
-        context = dict(super().context())
+        context = super().context()
         protocol = self.backend_config.get("protocol", "fc").lower()
 
-        driver_classes = {
-            "fc": (
-                "cinder.volume.drivers.ibm.storwize_svc.storwize_svc_fc"
-                ".StorwizeSVCFCDriver"
-            ),
-            "iscsi": (
-                "cinder.volume.drivers.ibm.storwize_svc.storwize_svc_iscsi"
-                ".StorwizeSVCISCSIDriver"
-            ),
-        }
-
-        driver_class = driver_classes.get(protocol, driver_classes["fc"])
+        driver_class = self._driver_classes.get(protocol, self._driver_classes["fc"])
         context.update({"volume_driver": driver_class})
         return context
 
@@ -511,6 +581,8 @@ class IbmstorwizesvcBackendContext(BaseBackendContext):
 class Inspuras13000BackendContext(BaseBackendContext):
     """Render a AS13000 backend stanza."""
 
+    __slots__ = ()
+
     def __init__(self, backend_name: str, backend_config: dict):
         """Initialize with backend name and config."""
         super().__init__(backend_name, backend_config)
@@ -518,7 +590,7 @@ class Inspuras13000BackendContext(BaseBackendContext):
 
     def context(self) -> dict:
         """Return context for AS13000 backend."""
-        context = dict(super().context())
+        context = super().context()
         context["volume_driver"] = (
             "cinder.volume.drivers.inspur.as13000.as13000_driver.AS13000Driver"
         )
@@ -528,7 +600,18 @@ class Inspuras13000BackendContext(BaseBackendContext):
 class InspurinstorageBackendContext(BaseBackendContext):
     """Render a InStorageMCS FC backend stanza."""
 
+    __slots__ = ()
+
     _hidden_keys = ("protocol",)
+    _driver_classes: typing.ClassVar[dict[str, str]] = {
+        "fc": (
+            "cinder.volume.drivers.inspur.instorage.instorage_fc.InStorageMCSFCDriver"
+        ),
+        "iscsi": (
+            "cinder.volume.drivers.inspur.instorage.instorage_iscsi"
+            ".InStorageMCSISCSIDriver"
+        ),
+    }
 
     def __init__(self, backend_name: str, backend_config: dict):
         """Initialize with backend name and config."""
@@ -537,21 +620,10 @@ class InspurinstorageBackendContext(BaseBackendContext):
 
     def context(self) -> dict:
         """Return context for InStorageMCS FC backend."""
-        context = dict(super().context())
+        context = super().context()
         protocol = self.backend_config.get("protocol", "fc").lower()
 
-        driver_classes = {
-            "fc": (
-                "cinder.volume.drivers.inspur.instorage.instorage_fc"
-                ".InStorageMCSFCDriver"
-            ),
-            "iscsi": (
-                "cinder.volume.drivers.inspur.instorage.instorage_iscsi"
-                ".InStorageMCSISCSIDriver"
-            ),
-        }
-
-        driver_class = driver_classes.get(protocol, driver_classes["fc"])
+        driver_class = self._driver_classes.get(protocol, self._driver_classes["fc"])
         context.update({"volume_driver": driver_class})
         return context
 
@@ -559,6 +631,8 @@ class InspurinstorageBackendContext(BaseBackendContext):
 class KaminarioBackendContext(BaseBackendContext):
     """Render a Kaminario iSCSI backend stanza."""
 
+    __slots__ = ()
+
     def __init__(self, backend_name: str, backend_config: dict):
         """Initialize with backend name and config."""
         super().__init__(backend_name, backend_config)
@@ -566,7 +640,7 @@ class KaminarioBackendContext(BaseBackendContext):
 
     def context(self) -> dict:
         """Return context for Kaminario iSCSI backend."""
-        context = dict(super().context())
+        context = super().context()
         context["volume_driver"] = (
             "cinder.volume.drivers.kaminario.kaminario_iscsi.KaminarioISCSIDriver"
         )
@@ -576,6 +650,8 @@ class KaminarioBackendContext(BaseBackendContext):
 class LinstorBackendContext(BaseBackendContext):
     """Render a LinstorIscsi backend stanza."""
 
+    __slots__ = ()
+
     def __init__(self, backend_name: str, backend_config: dict):
         """Initialize with backend name and config."""
         super().__init__(backend_name, backend_config)
@@ -583,7 +659,7 @@ class LinstorBackendContext(BaseBackendContext):
 
     def context(self) -> dict:
         """Return context for LinstorIscsi backend."""
-        context = dict(super().context())
+        context = super().context()
         context["volume_driver"] = "cinder.volume.drivers.linstordrv.LinstorIscsiDriver"
         return context
 
@@ -591,7 +667,13 @@ class LinstorBackendContext(BaseBackendContext):
 class MacrosanBackendContext(BaseBackendContext):
     """Render a MacroSAN iSCSI backend stanza."""
 
+    __slots__ = ()
+
     _hidden_keys = ("protocol",)
+    _driver_classes: typing.ClassVar[dict[str, str]] = {
+        "iscsi": "cinder.volume.drivers.macrosan.driver.MacroSANISCSIDriver",
+        "fc": "cinder.volume.drivers.macrosan.driver.MacroSANFCDriver",
+    }
 
     def __init__(self, backend_name: str, backend_config: dict):
         """Initialize with backend name and config."""
@@ -600,15 +682,10 @@ class MacrosanBackendContext(BaseBackendContext):
 
     def context(self) -> dict:
         """Return context for MacroSAN iSCSI backend."""
-        context = dict(super().context())
+        context = super().context()
         protocol = self.backend_config.get("protocol", "iscsi").lower()
 
-        driver_classes = {
-            "iscsi": "cinder.volume.drivers.macrosan.driver.MacroSANISCSIDriver",
-            "fc": "cinder.volume.drivers.macrosan.driver.MacroSANFCDriver",
-        }
-
-        driver_class = driver_classes.get(protocol, driver_classes["iscsi"])
+        driver_class = self._driver_classes.get(protocol, self._driver_classes["iscsi"])
         context.update({"volume_driver": driver_class})
         return context
 
@@ -616,7 +693,13 @@ class MacrosanBackendContext(BaseBackendContext):
 class NecvBackendContext(BaseBackendContext):
     """Render a VStorage FC backend stanza."""
 
+    __slots__ = ()
+
     _hidden_keys = ("protocol",)
+    _driver_classes: typing.ClassVar[dict[str, str]] = {
+        "fc": "cinder.volume.drivers.nec.v.nec_v_fc.VStorageFCDriver",
+        "iscsi": "cinder.volume.drivers.nec.v.nec_v_iscsi.VStorageISCSIDriver",
+    }
 
     def __init__(self, backend_name: str, backend_config: dict):
         """Initialize with backend name and config."""
@@ -625,15 +708,10 @@ class NecvBackendContext(BaseBackendContext):
 
     def context(self) -> dict:
         """Return context for VStorage FC backend."""
-        context = dict(super().context())
+        context = super().context()
         protocol = self.backend_config.get("protocol", "fc").lower()
 
-        driver_classes = {
-            "fc": "cinder.volume.drivers.nec.v.nec_v_fc.VStorageFCDriver",
-            "iscsi": "cinder.volume.drivers.nec.v.nec_v_iscsi.VStorageISCSIDriver",
-        }
-
-        driver_class = driver_classes.get(protocol, driver_classes["fc"])
+        driver_class = self._driver_classes.get(protocol, self._driver_classes["fc"])
         context.update({"volume_driver": driver_class})
         return context
 
@@ -641,7 +719,17 @@ class NecvBackendContext(BaseBackendContext):
 class NetappBackendContext(BaseBackendContext):
     """Render a NetApp ONTAP backend stanza."""
 
+    __slots__ = ()
+
     _hidden_keys = ("protocol",)
+    _driver_classes: typing.ClassVar[dict[str, str]] = {
+        "iscsi": (
+            "cinder.volume.drivers.netapp.dataontap.iscsi_cmode.NetAppCmodeISCSIDriver"
+        ),
+        "nvme": (
+            "cinder.volume.drivers.netapp.dataontap.nvme_cmode.NetAppCmodeNVMeDriver"
+        ),
+    }
 
     def __init__(self, backend_name: str, backend_config: dict):
         """Initialize with backend name and config."""
@@ -650,21 +738,10 @@ class NetappBackendContext(BaseBackendContext):
 
     def context(self) -> dict:
         """Return context for NetApp ONTAP backend."""
-        context = dict(super().context())
+        context = super().context()
         protocol = self.backend_config.get("protocol", "iscsi").lower()
 
-        driver_classes = {
-            "iscsi": (
-                "cinder.volume.drivers.netapp.dataontap.iscsi_cmode"
-                ".NetAppCmodeISCSIDriver"
-            ),
-            "nvme": (
-                "cinder.volume.drivers.netapp.dataontap.nvme_cmode"
-                ".NetAppCmodeNVMeDriver"
-            ),
-        }
-
-        driver_class = driver_classes.get(protocol, driver_classes["iscsi"])
+        driver_class = self._driver_classes.get(protocol, self._driver_classes["iscsi"])
         context.update({"volume_driver": driver_class})
         return context
 
@@ -672,6 +749,8 @@ class NetappBackendContext(BaseBackendContext):
 class NexentaBackendContext(BaseBackendContext):
     """Render a Nexenta iSCSI backend stanza."""
 
+    __slots__ = ()
+
     def __init__(self, backend_name: str, backend_config: dict):
         """Initialize with backend name and config."""
         super().__init__(backend_name, backend_config)
@@ -679,7 +758,7 @@ class NexentaBackendContext(BaseBackendContext):
 
     def context(self) -> dict:
         """Return context for Nexenta iSCSI backend."""
-        context = dict(super().context())
+        context = super().context()
         context["volume_driver"] = (
             "cinder.volume.drivers.nexenta.iscsi.NexentaISCSIDriver"
         )
@@ -689,7 +768,13 @@ class NexentaBackendContext(BaseBackendContext):
 class NimbleBackendContext(BaseBackendContext):
     """Render a HPE Nimble Storage backend stanza."""
 
+    __slots__ = ()
+
     _hidden_keys = ("protocol",)
+    _driver_classes: typing.ClassVar[dict[str, str]] = {
+        "iscsi": "cinder.volume.drivers.hpe.nimble.NimbleISCSIDriver",
+        "fc": "cinder.volume.drivers.hpe.nimble.NimbleFCDriver",
+    }
 
     def __init__(self, backend_name: str, backend_config: dict):
         """Initialize with backend name and config."""
@@ -698,15 +783,10 @@ class NimbleBackendContext(BaseBackendContext):
 
     def context(self) -> dict:
         """Return context for HPE Nimble Storage backend."""
-        context = dict(super().context())
+        context = super().context()
         protocol = self.backend_config.get("protocol", "iscsi").lower()
 
-        driver_classes = {
-            "iscsi": "cinder.volume.drivers.hpe.nimble.NimbleISCSIDriver",
-            "fc": "cinder.volume.drivers.hpe.nimble.NimbleFCDriver",
-        }
-
-        driver_class = driver_classes.get(protocol, driver_classes["iscsi"])
+        driver_class = self._driver_classes.get(protocol, self._driver_classes["iscsi"])
         context.update({"volume_driver": driver_class})
         return context
 
@@ -714,6 +794,8 @@ class NimbleBackendContext(BaseBackendContext):
 class OpeneBackendContext(BaseBackendContext):
     """Render a Jovian iSCSI backend stanza."""
 
+    __slots__ = ()
+
     def __init__(self, backend_name: str, backend_config: dict):
         """Initialize with backend name and config."""
         super().__init__(backend_name, backend_config)
@@ -721,7 +803,7 @@ class OpeneBackendContext(BaseBackendContext):
 
     def context(self) -> dict:
         """Return context for Jovian iSCSI backend."""
-        context = dict(super().context())
+        context = super().context()
         context["volume_driver"] = (
             "cinder.volume.drivers.open_e.iscsi.JovianISCSIDriver"
         )
@@ -731,7 +813,13 @@ class OpeneBackendContext(BaseBackendContext):
 class ProphetstorBackendContext(BaseBackendContext):
     """Render a DPL FC backend stanza."""
 
+    __slots__ = ()
+
     _hidden_keys = ("protocol",)
+    _driver_classes: typing.ClassVar[dict[str, str]] = {
+        "fc": "cinder.volume.drivers.prophetstor.dpl_fc.DPLFCDriver",
+        "iscsi": "cinder.volume.drivers.prophetstor.dpl_iscsi.DPLISCSIDriver",
+    }
 
     def __init__(self, backend_name: str, backend_config: dict):
         """Initialize with backend name and config."""
@@ -740,15 +828,10 @@ class ProphetstorBackendContext(BaseBackendContext):
 
     def context(self) -> dict:
         """Return context for DPL FC backend."""
-        context = dict(super().context())
+        context = super().context()
         protocol = self.backend_config.get("protocol", "fc").lower()
 
-        driver_classes = {
-            "fc": "cinder.volume.drivers.prophetstor.dpl_fc.DPLFCDriver",
-            "iscsi": "cinder.volume.drivers.prophetstor.dpl_iscsi.DPLISCSIDriver",
-        }
-
-        driver_class = driver_classes.get(protocol, driver_classes["fc"])
+        driver_class = self._driver_classes.get(protocol, self._driver_classes["fc"])
         context.update({"volume_driver": driver_class})
         return context
 
@@ -756,6 +839,8 @@ class ProphetstorBackendContext(BaseBackendContext):
 class QnapBackendContext(BaseBackendContext):
     """Render a QNAP Storage backend stanza."""
 
+    __slots__ = ()
+
     def __init__(self, backend_name: str, backend_config: dict):
         """Initialize with backend name and config."""
         super().__init__(backend_name, backend_config)
@@ -763,7 +848,7 @@ class QnapBackendContext(BaseBackendContext):
 
     def context(self) -> dict:
         """Return context for QNAP Storage backend."""
-        context = dict(super().context())
+        context = super().context()
         context["volume_driver"] = "cinder.volume.drivers.qnap.QnapISCSIDriver"
         return context
 
@@ -771,6 +856,8 @@ class QnapBackendContext(BaseBackendContext):
 class SandstoneBackendContext(BaseBackendContext):
     """Render a Sds iSCSI backend stanza."""
 
+    __slots__ = ()
+
     def __init__(self, backend_name: str, backend_config: dict):
         """Initialize with backend name and config."""
         super().__init__(backend_name, backend_config)
@@ -778,7 +865,7 @@ class SandstoneBackendContext(BaseBackendContext):
 
     def context(self) -> dict:
         """Return context for Sds iSCSI backend."""
-        context = dict(super().context())
+        context = super().context()
         context["volume_driver"] = (
             "cinder.volume.drivers.sandstone.sds_driver.SdsISCSIDriver"
         )
@@ -788,6 +875,8 @@ class SandstoneBackendContext(BaseBackendContext):
 class StxBackendContext(BaseBackendContext):
     """Render a Stx backend stanza."""
 
+    __slots__ = ()
+
     def __init__(self, backend_name: str, backend_config: dict):
         """Initialize with backend name and config."""
         super().__init__(backend_name, backend_config)
@@ -795,7 +884,7 @@ class StxBackendContext(BaseBackendContext):
 
     def context(self) -> dict:
         """Return context for Stx backend."""
-        context = dict(super().context())
+        context = super().context()
         context["volume_driver"] = "cinder.volume.drivers.stx.iscsi.STXISCSIDriver"
         return context
 
@@ -803,6 +892,8 @@ class StxBackendContext(BaseBackendContext):
 class SynologyBackendContext(BaseBackendContext):
     """Render a Syno iSCSI backend stanza."""
 
+    __slots__ = ()
+
     def __init__(self, backend_name: str, backend_config: dict):
         """Initialize with backend name and config."""
         super().__init__(backend_name, backend_config)
@@ -810,7 +901,7 @@ class SynologyBackendContext(BaseBackendContext):
 
     def context(self) -> dict:
         """Return context for Syno iSCSI backend."""
-        context = dict(super().context())
+        context = super().context()
         context["volume_driver"] = (
             "cinder.volume.drivers.synology.synology_iscsi.SynoISCSIDriver"
         )
@@ -820,7 +911,15 @@ class SynologyBackendContext(BaseBackendContext):
 class Toyouacs5000BackendContext(BaseBackendContext):
     """Render a Acs5000 FC backend stanza."""
 
+    __slots__ = ()
+
     _hidden_keys = ("protocol",)
+    _driver_classes: typing.ClassVar[dict[str, str]] = {
+        "fc": "cinder.volume.drivers.toyou.acs5000.acs5000_fc.Acs5000FCDriver",
+        "iscsi": (
+            "cinder.volume.drivers.toyou.acs5000.acs5000_iscsi.Acs5000ISCSIDriver"
+        ),
+    }
 
     def __init__(self, backend_name: str, backend_config: dict):
         """Initialize with backend name and config."""
@@ -829,17 +928,10 @@ class Toyouacs5000BackendContext(BaseBackendContext):
 
     def context(self) -> dict:
         """Return context for Acs5000 FC backend."""
-        context = dict(super().context())
+        context = super().context()
         protocol = self.backend_config.get("protocol", "fc").lower()
 
-        driver_classes = {
-            "fc": ("cinder.volume.drivers.toyou.acs5000.acs5000_fc.Acs5000FCDriver"),
-            "iscsi": (
-                "cinder.volume.drivers.toyou.acs5000.acs5000_iscsi.Acs5000ISCSIDriver"
-            ),
-        }
-
-        driver_class = driver_classes.get(protocol, driver_classes["fc"])
+        driver_class = self._driver_classes.get(protocol, self._driver_classes["fc"])
         context.update({"volume_driver": driver_class})
         return context
 
@@ -847,6 +939,8 @@ class Toyouacs5000BackendContext(BaseBackendContext):
 class VeritasaccessBackendContext(BaseBackendContext):
     """Render a ACCESSIscsi backend stanza."""
 
+    __slots__ = ()
+
     def __init__(self, backend_name: str, backend_config: dict):
         """Initialize with backend name and config."""
         super().__init__(backend_name, backend_config)
@@ -854,7 +948,7 @@ class VeritasaccessBackendContext(BaseBackendContext):
 
     def context(self) -> dict:
         """Return context for ACCESSIscsi backend."""
-        context = dict(super().context())
+        context = super().context()
         context["volume_driver"] = (
             "cinder.volume.drivers.veritas_access.veritas_iscsi.ACCESSIscsiDriver"
         )
@@ -864,7 +958,13 @@ class VeritasaccessBackendContext(BaseBackendContext):
 class YadroBackendContext(BaseBackendContext):
     """Render a Tatlin FCVolume backend stanza."""
 
+    __slots__ = ()
+
     _hidden_keys = ("protocol",)
+    _driver_classes: typing.ClassVar[dict[str, str]] = {
+        "fc": "cinder.volume.drivers.yadro.tatlin_fc.TatlinFCVolumeDriver",
+        "iscsi": "cinder.volume.drivers.yadro.tatlin_iscsi.TatlinISCSIVolumeDriver",
+    }
 
     def __init__(self, backend_name: str, backend_config: dict):
         """Initialize with backend name and config."""
@@ -873,15 +973,10 @@ class YadroBackendContext(BaseBackendContext):
 
     def context(self) -> dict:
         """Return context for Tatlin FCVolume backend."""
-        context = dict(super().context())
+        context = super().context()
         protocol = self.backend_config.get("protocol", "fc").lower()
 
-        driver_classes = {
-            "fc": "cinder.volume.drivers.yadro.tatlin_fc.TatlinFCVolumeDriver",
-            "iscsi": "cinder.volume.drivers.yadro.tatlin_iscsi.TatlinISCSIVolumeDriver",
-        }
-
-        driver_class = driver_classes.get(protocol, driver_classes["fc"])
+        driver_class = self._driver_classes.get(protocol, self._driver_classes["fc"])
         context.update({"volume_driver": driver_class})
         return context
 
@@ -889,6 +984,8 @@ class YadroBackendContext(BaseBackendContext):
 class ZadaraBackendContext(BaseBackendContext):
     """Render a ZadaraVPSA iSCSI backend stanza."""
 
+    __slots__ = ()
+
     def __init__(self, backend_name: str, backend_config: dict):
         """Initialize with backend name and config."""
         super().__init__(backend_name, backend_config)
@@ -896,7 +993,7 @@ class ZadaraBackendContext(BaseBackendContext):
 
     def context(self) -> dict:
         """Return context for ZadaraVPSA iSCSI backend."""
-        context = dict(super().context())
+        context = super().context()
         context["volume_driver"] = (
             "cinder.volume.drivers.zadara.zadara.ZadaraVPSAISCSIDriver"
         )
@@ -906,6 +1003,8 @@ class ZadaraBackendContext(BaseBackendContext):
 class CinderBackendContexts(Context):
     """Context provider for all Cinder backends."""
 
+    __slots__ = ("enabled_backends", "contexts", "_enabled_joined")
+
     namespace = "cinder_backends"
 
     def __init__(
@@ -918,22 +1017,36 @@ class CinderBackendContexts(Context):
         self.contexts = contexts
         if not enabled_backends:
             raise error.CinderError("At least one backend must be enabled")
-        missing_backends = set(self.enabled_backends) - set(contexts.keys())
+        missing_backends = [b for b in enabled_backends if b not in contexts]
         if missing_backends:
             raise error.CinderError(
-                "Context missing configuration for backends: %s" % missing_backends
+                "Context missing configuration for backends: %s" % set(missing_backends)
+            )
+        self._enabled_joined = ",".join(enabled_backends)
+
+    def all_directories(self) -> list[template.Directory]:
+        """Directories requested by the backends, without duplicates.
+
+        Directories are returned in backend order.
+        """
+        return list(
+            dict.fromkeys(
+                d for ctx in self.contexts.values() for d in ctx.directories()
             )
+        )
 
     def context(self) -> typing.Mapping[str, typing.Any]:
         """Return context for all backends."""
-        cluster_ok = all(ctx.supports_cluster for ctx in self.contexts.values())
+        cluster_ok = True
+        contexts = {}
+        for config in self.contexts.values():
+            if cluster_ok and not config.supports_cluster:
+                cluster_ok = False
+            contexts[config.backend_name] = config.cinder_context()
         return {
-            "enabled_backends": ",".join(self.enabled_backends),
+            "enabled_backends": self._enabled_joined,
             "cluster_ok": cluster_ok,
-            "contexts": {
-                config.backend_name: config.cinder_context()
-                for config in self.contexts.values()
-            },
+            "contexts": contexts,
         }
 
 
@@ -943,71 +1056,87 @@ ETC_CEPH = pathlib.Path("etc/ceph")
 class CephBackendContext(BaseBackendContext):
     """Context provider for Ceph backend."""
 
+    __slots__ = ("_keyring", "_ceph_conf", "_rbd_ceph_conf")
+
     _hidden_keys = ("rbd_key", "keyring", "mon_hosts", "auth")
 
     def __init__(self, backend_name: str, backend_config: dict[str, typing.Any]):
         """Initialize with backend name and config."""
         super().__init__(backend_name, backend_config)
         self.supports_cluster = True
+        self._keyring = f"ceph.client.{backend_name}.keyring"
+        self._ceph_conf = f"{backend_name}.conf"
+        self._rbd_ceph_conf = r"{{ snap_paths.common }}/etc/ceph/" + self._ceph_conf
+        self._directories = [
+            template.CommonDirectory(ETC_CEPH),
+        ]
+        self._template_files.extend(
+            [
+                template.CommonTemplate(
+                    self._ceph_conf, ETC_CEPH, template_name="ceph.conf.j2"
+                ),
+                template.CommonTemplate(
+                    self._keyring,
+                    ETC_CEPH,
+                    mode=0o600,
+                    template_name="ceph.client.keyring.j2",
+                ),
+            ]
+        )
 
     def keyring(self) -> str:
         """Return the keyring filename."""
-        return "ceph.client." + self.backend_name + ".keyring"
+        return self._keyring
 
     def ceph_conf(self) -> str:
         """Return the ceph config filename."""
-        return self.backend_name + ".conf"
+        return self._ceph_conf
 
-    def context(self) -> typing.Mapping[str, typing.Any]:
+    def context(self) -> dict[str, typing.Any]:
         """Return full context for Ceph backend."""
-        context = dict(super().context())
+        context = super().context()
         context["volume_driver"] = "cinder.volume.drivers.rbd.RBDDriver"
-        context["rbd_ceph_conf"] = (
-            r"{{ snap_paths.common }}/etc/ceph/" + self.ceph_conf()
-        )
-        context["keyring"] = self.keyring()
+        context["rbd_ceph_conf"] = self._rbd_ceph_conf
+        context["keyring"] = self._keyring
         return context
 
-    def directories(self) -> list[template.Directory]:
-        """Return directories to create."""
-        return [
-            template.CommonDirectory(ETC_CEPH),
-        ]
-
-    def template_files(self) -> list[template.Template]:
-        """Return template files to render."""
-        return super().template_files() + [
-            template.CommonTemplate(
-                self.ceph_conf(), ETC_CEPH, template_name="ceph.conf.j2"
-            ),
-            template.CommonTemplate(
-                self.keyring(),
-                ETC_CEPH,
-                mode=0o600,
-                template_name="ceph.client.keyring.j2",
-            ),
-        ]
-
 
 class HitachiBackendContext(BaseBackendContext):
     """Render a Hitachi VSP backend stanza."""
 
+    __slots__ = ()
+
     _hidden_keys = ("protocol", "hitachi_mirror_driver_ssl_cert")
+    _driver_classes: typing.ClassVar[dict[str, str]] = {
+        "fc": "cinder.volume.drivers.hitachi.hbsd_fc.HBSDFCDriver",
+        "iscsi": "cinder.volume.drivers.hitachi.hbsd_iscsi.HBSDISCSIDriver",
+    }
 
     def __init__(self, backend_name: str, backend_config: dict):
         """Initialize with backend name and config."""
         super().__init__(backend_name, backend_config)
         self.supports_cluster = False
+        self._template_files.append(
+            template.CommonTemplate(
+                f"{backend_name}_mirror.pem",
+                ETC_CINDER_D_CONF_DIR,
+                # TODO: find a better pattern when multiple backends
+                # also need a second certificate for the driver
+                template_name="hitachi_backend.pem.j2",
+                conditionals=[
+                    backend_variable_set(
+                        backend_name,
+                        "hitachi_mirror_ssl_cert_path",
+                    )
+                ],
+            )
+        )
 
     def context(self) -> dict:
         """Return context for Hitachi backend."""
-        context = dict(super().context())
+        context = super().context()
         proto = self.backend_config.get("protocol", "FC").lower()
-        driver_cls = (
-            "cinder.volume.drivers.hitachi.hbsd_fc.HBSDFCDriver"
-            if proto == "fc"
-            else "cinder.volume.drivers.hitachi.hbsd_iscsi.HBSDISCSIDriver"
-        )
+        driver_cls = self._driver_classes.get(proto, self._driver_classes["iscsi"])
         context.update(
             {
                 "volume_driver": driver_cls,
@@ -1026,29 +1155,18 @@ class HitachiBackendContext(BaseBackendContext):
             context["hitachi_mirror_ssl_cert_verify"] = True
         return context
 
-    def template_files(self) -> list[template.Template]:
-        """Files to be templated."""
-        return super().template_files() + [
-            template.CommonTemplate(
-                f"{self.backend_name}_mirror.pem",
-                ETC_CINDER_D_CONF_DIR,
-                # TODO: find a better pattern when multiple backends
-                # also need a second certificate for the driver
-                template_name="hitachi_backend.pem.j2",
-                conditionals=[
-                    backend_variable_set(
-                        self.backend_name,
-                        "hitachi_mirror_ssl_cert_path",
-                    )
-                ],
-            ),
-        ]
-
 
 class PureBackendContext(BaseBackendContext):
     """Render a Pure Storage FlashArray backend stanza."""
 
+    __slots__ = ()
+
     _hidden_keys = ("protocol",)
+    _driver_classes: typing.ClassVar[dict[str, str]] = {
+        "iscsi": "cinder.volume.drivers.pure.PureISCSIDriver",
+        "fc": "cinder.volume.drivers.pure.PureFCDriver",
+        "nvme": "cinder.volume.drivers.pure.PureNVMEDriver",
+    }
 
     def __init__(self, backend_name: str, backend_config: dict):
         """Initialize with backend name and config."""
@@ -1057,17 +1175,10 @@ class PureBackendContext(BaseBackendContext):
 
     def context(self) -> dict:
         """Return context for Pure backend."""
-        context = dict(super().context())
+        context = super().context()
         protocol = self.backend_config.get("protocol", "fc").lower()
 
-        # Driver class selection based on protocol
-        driver_classes = {
-            "iscsi": "cinder.volume.drivers.pure.PureISCSIDriver",
-            "fc": "cinder.volume.drivers.pure.PureFCDriver",
-            "nvme": "cinder.volume.drivers.pure.PureNVMEDriver",
-        }
-
-        driver_class = driver_classes.get(protocol, driver_classes["fc"])
+        driver_class = self._driver_classes.get(protocol, self._driver_classes["fc"])
 
         context.update(
             {
@@ -1080,7 +1191,15 @@ class PureBackendContext(BaseBackendContext):
 class DellscBackendContext(BaseBackendContext):
     """Render a Dell Storage Center backend stanza."""
 
+    __slots__ = ()
+
     _hidden_keys = ("protocol",)
+    _driver_classes: typing.ClassVar[dict[str, str]] = {
+        "iscsi": (
+            "cinder.volume.drivers.dell_emc.sc.storagecenter_iscsi.SCISCSIDriver"
+        ),
+        "fc": "cinder.volume.drivers.dell_emc.sc.storagecenter_fc.SCFCDriver",
+    }
 
     def __init__(self, backend_name: str, backend_config: dict):
         """Initialize with backend name and config."""
@@ -1089,18 +1208,10 @@ class DellscBackendContext(BaseBackendContext):
 
     def context(self) -> dict:
         """Return context for Dell SC backend."""
-        context = dict(super().context())
+        context = super().context()
         protocol = self.backend_config.get("protocol", "fc").lower()
 
-        # Driver class selection based on protocol
-        driver_classes = {
-            "iscsi": (
-                "cinder.volume.drivers.dell_emc.sc.storagecenter_iscsi.SCISCSIDriver"
-            ),
-            "fc": "cinder.volume.drivers.dell_emc.sc.storagecenter_fc.SCFCDriver",
-        }
-
-        driver_class = driver_classes.get(protocol, driver_classes["fc"])
+        driver_class = self._driver_classes.get(protocol, self._driver_classes["fc"])
 
         context.update(
             {
@@ -1113,6 +1224,8 @@ class DellscBackendContext(BaseBackendContext):
 class DellpowerstoreBackendContext(BaseBackendContext):
     """Render a Dell PowerStore backend stanza."""
 
+    __slots__ = ()
+
     _hidden_keys = ("protocol",)
 
     def __init__(self, backend_name: str, backend_config: dict):
@@ -1122,7 +1235,7 @@ class DellpowerstoreBackendContext(BaseBackendContext):
 
     def context(self) -> dict:
         """Return context for Dell PowerStore backend."""
-        context = dict(super().context())
+        context = super().context()
 
         # Driver class selection
         # Note that the class doesn't change across the configured protocols
@@ -1142,7 +1255,13 @@ class DellpowerstoreBackendContext(BaseBackendContext):
 class HpethreeparBackendContext(BaseBackendContext):
     """Render a HPE 3Par backend stanza."""
 
+    __slots__ = ()
+
     _hidden_keys = ("protocol",)
+    _driver_classes: typing.ClassVar[dict[str, str]] = {
+        "fc": "cinder.volume.drivers.hpe.hpe_3par_fc.HPE3PARFCDriver",
+        "iscsi": "cinder.volume.drivers.hpe.hpe_3par_iscsi.HPE3PARISCSIDriver",
+    }
 
     def __init__(self, backend_name: str, backend_config: dict):
         """Initialize with backend name and config."""
@@ -1151,17 +1270,12 @@ class HpethreeparBackendContext(BaseBackendContext):
 
     def context(self) -> dict:
         """Return context for HPE 3Par backend."""
-        context = dict(super().context())
+        context = super().context()
 
         protocol = self.backend_config.get("protocol", "fc").lower()
-        driver_classes = {
-            "fc": "cinder.volume.drivers.hpe.hpe_3par_fc.HPE3PARFCDriver",
-            "iscsi": "cinder.volume.drivers.hpe.hpe_3par_iscsi.HPE3PARISCSIDriver",
-        }
-
         context.update(
             {
-                "volume_driver": driver_classes[protocol],
+                "volume_driver": self._driver_classes[protocol],
             }
         )
         return context
@@ -1170,6 +1284,8 @@ class HpethreeparBackendContext(BaseBackendContext):
 class InfinidatBackendContext(BaseBackendContext):
     """Render an Infinidat InfiniBox backend stanza."""
 
+    __slots__ = ()
+
     _hidden_keys = ("protocol",)
 
     def __init__(self, backend_name: str, backend_config: dict):
@@ -1179,7 +1295,7 @@ class InfinidatBackendContext(BaseBackendContext):
 
     def context(self) -> dict:
         """Return context for Infinidat backend."""
-        context = dict(super().context())
+        context = super().context()
         protocol = self.backend_config.get("protocol", "iscsi").lower()
 
         # The upstream driver uses a single class for both protocols and
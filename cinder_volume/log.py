@@ -4,20 +4,71 @@
 """Logging utilities for the cinder-volume snap."""
 
 import logging
+import os
 from pathlib import Path
 
+_LOG_BUFFER_SIZE = 64 * 1024
+_DEBUG_ENV = "CINDER_VOLUME_DEBUG"
+
+
+class _BufferedFileHandler(logging.FileHandler):
+    """File handler writing through a large buffer.
+
+    Records below WARNING are left in the buffer, warnings and errors
+    flush it immediately. Remaining records are flushed on close, which
+    logging does at interpreter exit.
+    """
+
+    _defer_flush = False
+
+    def _open(self):
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=_LOG_BUFFER_SIZE,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write the record, flushing only for warnings and above."""
+        # emit() runs under the handler lock, so the flag is not shared
+        self._defer_flush = record.levelno < logging.WARNING
+        try:
+            super().emit(record)
+        finally:
+            self._defer_flush = False
+
+    def flush(self) -> None:
+        """Flush the stream unless a low level record is being emitted."""
+        if not self._defer_flush:
+            super().flush()
+
 
 def setup_logging(logfile: Path | str) -> None:
     """Sets up the logging for the specified logfile.
 
+    Records are logged at INFO level, DEBUG is enabled by setting
+    CINDER_VOLUME_DEBUG in the environment.
+
     :param logfile: the file to record logging information to
     :type logfile: Path or str
     :return: None
     """
+    target = os.path.abspath(os.fspath(logfile))
+    for handler in logging.getLogger().handlers:
+        if isinstance(handler, logging.FileHandler) and handler.baseFilename == target:
+            return
+
+    level = logging.DEBUG if os.environ.get(_DEBUG_ENV) else logging.INFO
+    # None of the services log from threads or subprocesses that need
+    # telling apart, skip collecting those record attributes.
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
     logging.basicConfig(
-        filename=str(logfile),
-        filemode="a",
+        handlers=[_BufferedFileHandler(target, mode="a", delay=True)],
         format="%(asctime)s,%(msecs)d %(name)s %(levelname)s %(message)s",
         datefmt="%H:%M:%S",
-        level=logging.DEBUG,
+        level=level,
     )
@@ -4,16 +4,19 @@
 """Snap helpers script for filtering hooks by project."""
 
 import importlib.metadata
+import logging
 import os
-import pathlib
 
 from snaphelpers.scripts import snap_helpers as sh
 
+logger = logging.getLogger(__name__)
+
 CRAFT_PART_BUILD = os.environ["CRAFT_PART_BUILD"]
 
 original_get_hooks = sh.get_hooks
 
-paths = list(pathlib.Path(CRAFT_PART_BUILD).glob("*.egg-info"))
+with os.scandir(CRAFT_PART_BUILD) as entries:
+    paths = [entry.path for entry in entries if entry.name.endswith(".egg-info")]
 
 if len(paths) == 0:
     raise Exception(f"No egg-info found at {CRAFT_PART_BUILD}")
@@ -28,17 +31,18 @@ dist_info = importlib.metadata.Distribution.at(dist_info_path)
 if dist_info.name is None:
     raise Exception(f"Could not determine project name from {dist_info_path}")
 
+_PROJECT_NAME = dist_info.name
+
 
 def filtered_hooks(*args, **kwargs):
     """Filtered hooks by build project."""
+    name = _PROJECT_NAME
     hooks = original_get_hooks(*args, **kwargs)
-    hooks_ = []
-    for hook in hooks:
-        if hook.project != dist_info.name:
-            print("Filtering out ", hook.name, "from", hook.project)
-            continue
-        hooks_.append(hook)
-    return hooks_
+    if logger.isEnabledFor(logging.DEBUG):
+        for hook in hooks:
+            if hook.project != name:
+                logger.debug("Filtering out %s from %s", hook.name, hook.project)
+    return [hook for hook in hooks if hook.project == name]
 
 
 sh.get_hooks = filtered_hooks
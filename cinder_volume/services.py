@@ -5,30 +5,42 @@
 
 import functools
 import logging
-import subprocess
+import os
 import sys
 import typing
 from pathlib import Path
 
-from snaphelpers import Snap
-
 from . import log
 
-_SERVICES: list[typing.Type["OpenStackService"]] = []
+if typing.TYPE_CHECKING:
+    from snaphelpers import Snap
+
+_SERVICES: tuple[typing.Type["OpenStackService"], ...] = ()
 
 
 def entry_point(service_class):
     """Entry point wrapper for services."""
+    from snaphelpers import Snap
+
     service = service_class()
-    exit_code = service.run(Snap())
-    sys.exit(exit_code)
+    service.run(Snap())
 
 
-def services() -> typing.Sequence[typing.Type["OpenStackService"]]:
-    """Return the list of registered services."""
+def services() -> tuple[typing.Type["OpenStackService"], ...]:
+    """Return the registered services."""
     return _SERVICES
 
 
+_S = typing.TypeVar("_S", bound=typing.Type["OpenStackService"])
+
+
+def register_service(service_class: _S) -> _S:
+    """Register a service class, for use as a class decorator."""
+    global _SERVICES
+    _SERVICES += (service_class,)
+    return service_class
+
+
 class OpenStackService:
     """Base service object for OpenStack daemons."""
 
@@ -42,50 +54,78 @@ class OpenStackService:
     name: str
     executable: Path
 
-    def __init_subclass__(cls, **kwargs):
-        """Register inherited classes."""
-        super().__init_subclass__(**kwargs)
-        _SERVICES.append(cls)
+    @classmethod
+    @functools.cache
+    def _config_args(cls, common: str) -> tuple[str, ...]:
+        """Return the --config-file and --config-dir arguments.
 
-    def run(self, snap: Snap) -> int:
+        :param common: the snap common path
+        :type common: str
+        :return: flat tuple of command line arguments
+        :rtype: tuple[str, ...]
+        """
+        args: list[str] = []
+        for conf_file in cls.configuration_files:
+            args += ("--config-file", os.path.join(common, conf_file))
+        for conf_dir in cls.configuration_directories:
+            args += ("--config-dir", os.path.join(common, conf_dir))
+        return tuple(args)
+
+    @classmethod
+    @functools.cache
+    def _executable_path(cls, snap_path: str) -> str:
+        """Return the full path of the service executable.
+
+        :param snap_path: the snap installation path
+        :type snap_path: str
+        :return: path of the executable
+        :rtype: str
+        """
+        return os.path.join(snap_path, cls.executable)
+
+    @classmethod
+    @functools.cache
+    def _log_path(cls, common: str, snap_name: str) -> str:
+        """Return the path of the service log file.
+
+        :param common: the snap common path
+        :type common: str
+        :param snap_name: the name of the snap
+        :type snap_name: str
+        :return: path of the log file
+        :rtype: str
+        """
+        return os.path.join(common, f"{cls.executable.name}-{snap_name}.log")
+
+    def run(self, snap: "Snap") -> typing.NoReturn:
         """Runs the OpenStack service.
 
-        Invoked when this service is started.
+        Invoked when this service is started. The current process is
+        replaced by the service executable, this method only returns by
+        exiting with code 127 when the executable cannot be started.
 
         :param snap: the snap context
         :type snap: Snap
-        :return: exit code of the process
-        :rtype: int
         """
-        log.setup_logging(snap.paths.common / f"{self.executable.name}-{snap.name}.log")
-
-        args = []
-        for conf_file in self.configuration_files:
-            args.extend(
-                [
-                    "--config-file",
-                    str(snap.paths.common / conf_file),
-                ]
-            )
-        for conf_dir in self.configuration_directories:
-            args.extend(
-                [
-                    "--config-dir",
-                    str(snap.paths.common / conf_dir),
-                ]
-            )
-
-        executable = snap.paths.snap / self.executable
-
-        cmd = [str(executable)]
-        cmd.extend(args)
-        cmd.extend(self.extra_args)
-        completed_process = subprocess.run(cmd)
-
-        logging.info(f"Exiting with code {completed_process.returncode}")
-        return completed_process.returncode
-
-
+        log.setup_logging(self._log_path(str(snap.paths.common), snap.name))
+
+        cmd = [
+            self._executable_path(str(snap.paths.snap)),
+            *self._config_args(str(snap.paths.common)),
+            *self.extra_args,
+        ]
+        logging.info("Executing %s", cmd)
+        # exec does not run atexit handlers, flush the log first
+        logging.shutdown()
+        try:
+            os.execv(cmd[0], cmd)
+        except OSError:
+            logging.exception("Failed to execute %s", cmd[0])
+            logging.shutdown()
+            sys.exit(127)
+
+
+@register_service
 class CinderVolume(OpenStackService):
     """Cinder volume service implementation."""
 
@@ -99,4 +139,6 @@ class CinderVolume(OpenStackService):
     executable = Path("usr/bin/cinder-volume")
 
 
-cinder_volume = functools.partial(entry_point, CinderVolume)
+def cinder_volume():
+    """Entry point for the cinder-volume service."""
+    entry_point(CinderVolume)
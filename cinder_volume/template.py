@@ -3,15 +3,19 @@
 
 """Template and directory classes for configuration."""
 
+import dataclasses
 import typing
 from pathlib import Path
 
 Locations = typing.Literal["common", "data"]
 
 
+@dataclasses.dataclass(init=False, eq=False, frozen=True, slots=True)
 class Directory:
     """Represents a directory to be created."""
 
+    _default_location: typing.ClassVar[Locations] = "common"
+
     path: Path
     mode: int
     location: Locations
@@ -20,25 +24,42 @@ class Directory:
         self, path: str | Path, mode: int = 0o750, location: Locations | None = None
     ):
         """Initialize directory with path, mode, and location."""
-        self.path = Path(path)
-        self.mode = mode
-        self.location = (
-            location
-            if location is not None
-            else getattr(self.__class__, "location", "common")
+        object.__setattr__(self, "path", Path(path))
+        object.__setattr__(self, "mode", mode)
+        object.__setattr__(
+            self,
+            "location",
+            location if location is not None else self._default_location,
         )
 
+    def _key(self) -> tuple[Path, int, str]:
+        return (self.path, self.mode, self.location)
+
+    def __eq__(self, other: object) -> bool:
+        """Directories are equal when they create the same path the same way."""
+        if not isinstance(other, Directory):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        """Hash on path, mode and location."""
+        return hash(self._key())
+
 
 class CommonDirectory(Directory):
     """Directory in the common location."""
 
-    location = "common"
+    __slots__ = ()
+
+    _default_location = "common"
 
 
 class DataDirectory(Directory):
     """Directory in the data location."""
 
-    location = "data"
+    __slots__ = ()
+
+    _default_location = "data"
 
 
 ContextType = typing.Mapping[str, typing.Any]
@@ -50,15 +71,22 @@ def true_conditional(_: ContextType) -> bool:
     return True
 
 
+@dataclasses.dataclass(init=False, eq=False, frozen=True, slots=True)
 class Template:
     """Represents a template file to be rendered."""
 
+    _default_location: typing.ClassVar[Locations] = "common"
+
     filename: str
     dest: Path
     mode: int
     template_name: str | None
     location: Locations
     conditionals: typing.Sequence[Conditional]
+    _effective_name: str = dataclasses.field(repr=False)
+    _rel_path: Path = dataclasses.field(repr=False)
+    _output_path: Path = dataclasses.field(repr=False)
+    _always_true: bool = dataclasses.field(repr=False)
 
     def __init__(
         self,
@@ -70,37 +98,55 @@ class Template:
         conditionals: typing.Sequence[Conditional] = (true_conditional,),
     ):
         """Initialize template with source, destination, and options."""
-        self.filename = src
-        self.dest = dest
-        self.mode = mode
-        self.template_name = template_name
-        self.location = (
-            location
-            if location is not None
-            else getattr(self.__class__, "location", "common")
+        effective_name = template_name or src
+        set_ = object.__setattr__
+        set_(self, "filename", src)
+        set_(self, "dest", dest)
+        set_(self, "mode", mode)
+        set_(self, "template_name", template_name)
+        set_(
+            self,
+            "location",
+            location if location is not None else self._default_location,
+        )
+        set_(self, "conditionals", conditionals)
+        set_(self, "_effective_name", effective_name)
+        set_(self, "_rel_path", dest / effective_name)
+        set_(self, "_output_path", dest / src.removesuffix(".j2"))
+        set_(
+            self,
+            "_always_true",
+            all(cond is true_conditional for cond in conditionals),
         )
-        self.conditionals = conditionals
 
     def rel_path(self) -> Path:
         """Return the relative path of the template."""
-        return self.dest / self.template()
+        return self._rel_path
 
     def output_path(self) -> Path:
         """Return the relative path of the rendered output file."""
-        return self.dest / self.filename.removesuffix(".j2")
+        return self._output_path
 
     def template(self) -> str:
         """Return the template name or filename."""
-        return self.template_name or self.filename
+        return self._effective_name
+
+    def should_render(self, context: ContextType) -> bool:
+        """Return whether all conditionals are met for the context."""
+        return self._always_true or all(cond(context) for cond in self.conditionals)
 
 
 class CommonTemplate(Template):
     """Template for common location."""
 
-    location = "common"
+    __slots__ = ()
+
+    _default_location = "common"
 
 
 class DataTemplate(Template):
     """Template for data location."""
 
-    location = "data"
+    __slots__ = ()
+
+    _default_location = "data"
@@ -3,9 +3,32 @@
 
 """Pytest configuration and fixtures."""
 
+import dataclasses
+
 import pytest
 
 
+@dataclasses.dataclass(slots=True)
+class FakePaths:
+    """Snap paths with the slots SnapPathContext reads."""
+
+    common: str = "/snap/common"
+    data: str = "/snap/data"
+
+
+@dataclasses.dataclass
+class FakeSnap:
+    """Minimal stand-in for snaphelpers.Snap."""
+
+    paths: FakePaths = dataclasses.field(default_factory=FakePaths)
+
+
+@pytest.fixture
+def fake_snap():
+    """Snap with fixed common and data paths."""
+    return FakeSnap()
+
+
 @pytest.fixture
 def sample_database_config():
     """Sample database configuration for testing."""
@@ -12,7 +12,7 @@ from unittest.mock import Mock, patch
 import jinja2
 import pytest
 
-from cinder_volume import context, error
+from cinder_volume import context, error, template
 
 
 class TestBaseBackendContext:
@@ -41,6 +41,24 @@ class TestBaseBackendContext:
         result = ctx.context()
         assert result == backend_config
 
+    def test_base_backend_cached_context_is_computed_once(self):
+        """Test cached_context only builds the context on first use."""
+        backend_config = {"volume_backend_name": "test-backend"}
+        ctx = context.BaseBackendContext("test-backend", backend_config)
+
+        with patch.object(
+            context.BaseBackendContext,
+            "context",
+            autospec=True,
+            side_effect=context.BaseBackendContext.context,
+        ) as m:
+            first = ctx.cached_context()
+            ctx.cinder_context()
+
+        assert ctx.cached_context() is first
+        assert first == backend_config
+        m.assert_called_once_with(ctx)
+
     def test_base_backend_context_with_driver_ssl_cert(self):
         """Test context method with driver_ssl_cert adds path and verify."""
         backend_config = {
@@ -92,6 +110,35 @@ class TestBaseBackendContext:
         assert templates[1].filename == "test-backend.pem"
         assert templates[1].template_name == "backend.pem.j2"
 
+    def test_base_backend_template_files_built_once(self):
+        """Test template_files returns the same templates on every call."""
+        ctx = context.BaseBackendContext("test-backend", {})
+
+        assert ctx.template_files() is ctx.template_files()
+        assert ctx.directories() is ctx.directories()
+
+    def test_ceph_backend_template_files(self):
+        """Test Ceph backend adds its config and keyring templates."""
+        ctx = context.CephBackendContext("ceph01", {})
+        filenames = [tpl.filename for tpl in ctx.template_files()]
+
+        assert filenames == [
+            "ceph01.conf",
+            "ceph01.pem",
+            "ceph01.conf",
+            "ceph.client.ceph01.keyring",
+        ]
+        assert [d.path for d in ctx.directories()] == [context.ETC_CEPH]
+
+    def test_backend_contexts_have_no_instance_dict(self):
+        """Test backend contexts only use slotted attributes."""
+        for ctx in (
+            context.BaseBackendContext("test-backend", {}),
+            context.CephBackendContext("ceph01", {}),
+            context.HitachiBackendContext("hitachi01", {}),
+        ):
+            assert not hasattr(ctx, "__dict__")
+
     def test_base_backend_pem_template_conditional(self):
         """Test that .pem template has conditional for driver_ssl_cert_path."""
         ctx = context.BaseBackendContext("test-backend", {})
@@ -154,6 +201,20 @@ class TestCinderBackendContexts:
         ):
             context.CinderBackendContexts(["backend1", "backend2"], contexts)
 
+    def test_cinder_backend_contexts_all_directories(self):
+        """Test directories shared by several backends are listed once."""
+        ceph1 = context.CephBackendContext("ceph01", {})
+        ceph2 = context.CephBackendContext("ceph02", {})
+        base = context.BaseBackendContext("base", {})
+        contexts = context.CinderBackendContexts(
+            ["ceph01", "base", "ceph02"],
+            {"ceph01": ceph1, "base": base, "ceph02": ceph2},
+        )
+
+        assert contexts.all_directories() == [
+            template.CommonDirectory(context.ETC_CEPH)
+        ]
+
     def test_cinder_backend_contexts_context_method(self):
         """Test the context method returns enabled_backends and cluster_ok."""
         ctx1 = context.BaseBackendContext("backend1", {"volume_backend_name": "b1"})
@@ -2,11 +2,38 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from pathlib import Path
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import jinja2
+import pytest
 
-from cinder_volume import cinder_volume, context, template
+from cinder_volume import cinder_volume, configuration, context, template
+
+CEPH_OPTIONS = {
+    "database": {"url": "sqlite:///test.db"},
+    "rabbitmq": {"url": "amqp://localhost"},
+    "cinder": {"project-id": "project-id", "user-id": "user-id"},
+    "ceph": {
+        "ceph01": {
+            "volume-backend-name": "ceph01",
+            "mon-hosts": "10.0.0.1",
+            "rbd-pool": "volumes",
+            "rbd-user": "cinder",
+            "rbd-secret-uuid": "uuid",
+            "rbd-key": "key",
+        }
+    },
+}
+
+
+def _snap(tmp_path: Path, options: dict) -> Mock:
+    """Build a snap mock rooted in a temporary directory."""
+    snap = Mock()
+    snap.paths.__slots__ = ["common", "data"]
+    snap.paths.common = tmp_path / "common"
+    snap.paths.data = tmp_path / "data"
+    snap.config.get_options.return_value.as_dict.return_value = options
+    return snap
 
 
 def _get_section(rendered: str, section: str) -> str:
@@ -32,6 +59,261 @@ class TestGenericCinderVolume:
             for tpl in template_files
         )
 
+    def test_template_environment_is_shared(self, tmp_path):
+        """Environments are cached per search path and reused across calls."""
+        search_path = [tmp_path / "templates"]
+
+        env = cinder_volume._environment(search_path)
+
+        assert cinder_volume._environment(list(search_path)) is env
+        assert cinder_volume._environment([tmp_path]) is not env
+        assert env.globals["cinder_ctx"] is context.cinder_ctx
+
+    def test_render_specific_backend_configs_renders_values(self):
+        """String values are rendered against the context, others untouched."""
+        service = cinder_volume.GenericCinderVolume()
+
+        rendered = service._render_specific_backend_configs(
+            {"snap_paths": {"common": "/common"}},
+            {
+                "conf": "{{ snap_paths.common }}/etc/ceph/ceph.conf",
+                "nested": {
+                    "port": 3260,
+                    "name": "plain",
+                    "deeper": {"path": "{{ snap_paths.common }}", "list": ["a"]},
+                },
+            },
+        )
+
+        assert rendered == {
+            "conf": "/common/etc/ceph/ceph.conf",
+            "nested": {
+                "port": 3260,
+                "name": "plain",
+                "deeper": {"path": "/common", "list": ["a"]},
+            },
+        }
+        assert list(rendered["nested"]) == ["port", "name", "deeper"]
+
+    def test_render_value_matches_jinja(self):
+        """Plain values skip Jinja but render exactly as Jinja would."""
+        ctx = {"snap_paths": {"common": "/common"}}
+        values = [
+            "plain",
+            "",
+            "a,b;c=d",
+            "{not-jinja}",
+            "{# comment #}value",
+            "{% if true %}yes{% endif %}",
+            "line\n",
+            "windows\r\nline",
+        ]
+
+        cinder_volume._value_template.cache_clear()
+        for value in values:
+            expected = jinja2.Template(value).render(ctx)
+            assert cinder_volume._render_value(value, ctx) == expected
+
+        assert cinder_volume._value_template.cache_info().currsize == 5
+
+    def test_configuration_is_read_once(self, tmp_path):
+        """Configuration is fetched and validated once per instance."""
+        snap = _snap(tmp_path, CEPH_OPTIONS)
+        service = cinder_volume.GenericCinderVolume()
+
+        service.backend_contexts(snap)
+        service.contexts(snap)
+
+        assert service.get_config(snap) is service.get_config(snap)
+        snap.config.get_options.assert_called_once()
+
+    def test_backend_contexts_are_built_once(self, tmp_path):
+        """Backend contexts are cached and can be handed to template()."""
+        snap = _snap(tmp_path, CEPH_OPTIONS)
+        service = cinder_volume.GenericCinderVolume()
+        backend_contexts = service.backend_contexts(snap)
+
+        assert service.backend_contexts(snap) is backend_contexts
+        with patch.object(service, "backend_contexts") as m:
+            service.template(snap, backend_contexts)
+        m.assert_not_called()
+
+    def test_dump_backend_config_matches_model_dump(self):
+        """The flat dump fast path returns exactly what model_dump does."""
+        configs = [
+            configuration.CephConfiguration(
+                **CEPH_OPTIONS["ceph"]["ceph01"], **{"rbd-flatten": True}
+            ),
+            configuration.DellSCConfiguration(
+                **{
+                    "volume-backend-name": "dellsc01",
+                    "san-ip": "10.0.0.10",
+                    "san-login": "admin",
+                    "san-password": "secret",
+                    "dell-sc-ssn": 64702,
+                    "protocol": "fc",
+                    "enable-unsupported-driver": True,
+                    "extra-option": "value",
+                    "extra-mapping": {"key": "value"},
+                }
+            ),
+        ]
+
+        for config in configs:
+            dumped = cinder_volume._dump_backend_config(config)
+            assert dumped == config.model_dump()
+            assert list(dumped) == list(config.model_dump())
+
+    def test_render_context_returns_a_copy(self, tmp_path):
+        """Callers may extend the render context without affecting the cache."""
+        snap = _snap(tmp_path, CEPH_OPTIONS)
+        service = cinder_volume.GenericCinderVolume()
+
+        ctx = service.render_context(snap)
+        ctx["extra"] = {}
+
+        assert "extra" not in service.render_context(snap)
+        assert service.render_context(snap) == {k: ctx[k] for k in ctx if k != "extra"}
+
+    def test_setup_dirs_only_fixes_wrong_modes(self, tmp_path):
+        """Existing directories with the right mode are left untouched."""
+        snap = _snap(tmp_path, CEPH_OPTIONS)
+        service = cinder_volume.GenericCinderVolume()
+        service.setup_dirs(snap)
+
+        etc_cinder = snap.paths.common / "etc/cinder"
+        lib_cinder = snap.paths.common / "lib/cinder"
+        etc_cinder.chmod(0o700)
+        with patch.object(Path, "chmod", autospec=True, side_effect=Path.chmod) as m:
+            service.setup_dirs(snap)
+
+        assert [c.args[0] for c in m.call_args_list] == [etc_cinder]
+        assert etc_cinder.stat().st_mode & 0o777 == 0o750
+        assert lib_cinder.stat().st_mode & 0o777 == 0o750
+
+    def test_template_creates_destination_directories(self, tmp_path):
+        """Templates can be rendered without setting up directories first."""
+        snap = _snap(tmp_path, CEPH_OPTIONS)
+        service = cinder_volume.GenericCinderVolume()
+
+        service.template(snap)
+
+        assert (snap.paths.common / "etc/cinder/cinder.conf.d/ceph01.conf").exists()
+        assert (snap.paths.common / "etc/ceph/ceph.client.ceph01.keyring").exists()
+
+    def test_templates_search_path(self, tmp_path):
+        """The search path puts snap overrides before packaged templates."""
+        snap = _snap(tmp_path, CEPH_OPTIONS)
+        service = cinder_volume.GenericCinderVolume()
+        package_templates = Path(cinder_volume.__file__).parent / "templates"
+
+        search_path = service.templates_search_path(snap)
+
+        assert search_path == [
+            snap.paths.common / "templates",
+            package_templates,
+            package_templates,
+        ]
+        search_path.append(tmp_path)
+        assert tmp_path not in service.templates_search_path(snap)
+
+    def test_template_only_reports_changed_files(self, tmp_path):
+        """Templates matching the file on disk are not rewritten."""
+        snap = _snap(tmp_path, CEPH_OPTIONS)
+        service = cinder_volume.GenericCinderVolume()
+        service.setup_dirs(snap, service.backend_contexts(snap))
+
+        modified = service.template(snap)
+
+        assert {tpl.filename for tpl in modified} == {
+            "cinder.conf",
+            "rootwrap.conf",
+            "ceph01.conf",
+            "ceph.client.ceph01.keyring",
+        }
+        keyring = snap.paths.common / "etc/ceph/ceph.client.ceph01.keyring"
+        assert keyring.stat().st_mode & 0o777 == 0o600
+
+        assert cinder_volume.GenericCinderVolume().template(snap) == []
+
+        cinder_conf = snap.paths.common / "etc/cinder/cinder.conf"
+        cinder_conf.write_text(cinder_conf.read_text().replace("[", "<"))
+        modified = cinder_volume.GenericCinderVolume().template(snap)
+
+        assert [tpl.filename for tpl in modified] == ["cinder.conf"]
+        assert "[DEFAULT]" in cinder_conf.read_text()
+
+    def test_template_renders_each_backend_with_its_own_context(self, tmp_path):
+        """Backends rendered concurrently keep their order and context."""
+        backends = {
+            f"ceph0{i}": {
+                **CEPH_OPTIONS["ceph"]["ceph01"],
+                "volume-backend-name": f"ceph0{i}",
+                "rbd-pool": f"volumes{i}",
+            }
+            for i in range(1, 4)
+        }
+        snap = _snap(tmp_path, {**CEPH_OPTIONS, "ceph": backends})
+
+        modified = cinder_volume.GenericCinderVolume().template(snap)
+
+        assert [str(tpl.output_path()) for tpl in modified][2:] == [
+            path
+            for i in range(1, 4)
+            for path in (
+                f"etc/cinder/cinder.conf.d/ceph0{i}.conf",
+                f"etc/ceph/ceph0{i}.conf",
+                f"etc/ceph/ceph.client.ceph0{i}.keyring",
+            )
+        ]
+        conf_d = snap.paths.common / "etc/cinder/cinder.conf.d"
+        for i in range(1, 4):
+            conf = (conf_d / f"ceph0{i}.conf").read_text()
+            assert f"[ceph0{i}]" in conf
+            assert f"rbd_pool = volumes{i}" in conf
+
+    def test_template_does_not_read_back_known_files(self, tmp_path):
+        """Files written by this process are not re-read when unchanged."""
+        snap = _snap(tmp_path, CEPH_OPTIONS)
+        cinder_volume.GenericCinderVolume().template(snap)
+
+        with patch.object(Path, "open", autospec=True, side_effect=Path.open) as m:
+            assert cinder_volume.GenericCinderVolume().template(snap) == []
+
+        m.assert_not_called()
+
+    def test_template_writes_nothing_when_rendering_fails(self, tmp_path):
+        """Files are only written once every template rendered."""
+        snap = _snap(tmp_path, CEPH_OPTIONS)
+        service = cinder_volume.GenericCinderVolume()
+        render = service._render_template
+
+        def failing_render(locations, env, tpl, ctx):
+            if tpl.filename.endswith(".keyring"):
+                raise jinja2.TemplateError("boom")
+            return render(locations, env, tpl, ctx)
+
+        with patch.object(service, "_render_template", side_effect=failing_render):
+            with pytest.raises(jinja2.TemplateError):
+                service.template(snap)
+
+        assert not (snap.paths.common / "etc/cinder/cinder.conf").exists()
+
+    def test_template_rewrite_restores_mode(self, tmp_path):
+        """Rewriting an existing file also restores the template mode."""
+        snap = _snap(tmp_path, CEPH_OPTIONS)
+        cinder_volume.GenericCinderVolume().template(snap)
+        keyring = snap.paths.common / "etc/ceph/ceph.client.ceph01.keyring"
+        expected = keyring.read_bytes()
+        keyring.write_text("stale\n")
+        keyring.chmod(0o644)
+
+        modified = cinder_volume.GenericCinderVolume().template(snap)
+
+        assert [tpl.filename for tpl in modified] == ["ceph.client.ceph01.keyring"]
+        assert keyring.read_bytes() == expected
+        assert keyring.stat().st_mode & 0o777 == 0o600
+
     def test_start_services_restarts_on_restart_trigger_file(self):
         """A changed CA bundle should restart the cinder-volume service."""
         service = cinder_volume.GenericCinderVolume()
@@ -51,6 +333,37 @@ class TestGenericCinderVolume:
         snap_service.restart.assert_called_once_with()
         snap_service.start.assert_not_called()
 
+    def test_start_services_restarts_on_backend_file(self):
+        """A changed backend file should restart the cinder-volume service."""
+        service = cinder_volume.GenericCinderVolume()
+        snap = Mock()
+        snap_service = Mock()
+        snap.services.list.return_value = {"cinder-volume": snap_service}
+        backend_tpl = template.CommonTemplate(
+            "ceph01.conf", Path("etc/cinder/cinder.conf.d")
+        )
+
+        service.start_services(snap, [backend_tpl], [backend_tpl])
+
+        snap_service.restart.assert_called_once_with()
+        snap_service.start.assert_not_called()
+
+    def test_start_services_starts_when_nothing_relevant_changed(self):
+        """Unrelated modifications only ensure the service is started."""
+        service = cinder_volume.GenericCinderVolume()
+        snap = Mock()
+        snap_service = Mock()
+        snap.services.list.return_value = {"cinder-volume": snap_service}
+        modified = [template.CommonTemplate("unrelated.conf", Path("etc/cinder"))]
+        backend_tpl = template.CommonTemplate(
+            "ceph01.conf", Path("etc/cinder/cinder.conf.d")
+        )
+
+        service.start_services(snap, modified, [backend_tpl])
+
+        snap_service.start.assert_called_once_with()
+        snap_service.restart.assert_not_called()
+
     def test_backend_contexts_discovers_infinidat_backend(self):
         """Configured Infinidat backends should be loaded at runtime."""
         service = cinder_volume.GenericCinderVolume()
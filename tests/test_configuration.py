@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import pydantic
+import pydantic_core
 import pytest
 
 from cinder_volume import configuration
@@ -18,6 +19,7 @@ class TestToKebab:
             ("snake_case", "snake-case"),
             ("kebab-case", "kebab-case"),
             ("simple", "simple"),
+            ("ceph-pool1", "ceph-pool-1"),
             ("", ""),
         ],
     )
@@ -415,6 +417,35 @@ class TestHpethreeparConfiguration:
         assert config.hpe3par_iscsi_ips == "10.0.0.11,10.0.0.12"
         assert config.hpe3par_iscsi_chap_enabled == "true"
 
+    def test_hpe3par_validation_does_not_modify_input(self):
+        """Converting extra field names leaves the caller's mapping alone."""
+        data = {
+            "volume-backend-name": "hpe3par01",
+            "san-ip": "10.0.0.10",
+            "san-login": "admin",
+            "san-password": "secret",
+            "hpe3par-debug": "true",
+        }
+        original = dict(data)
+
+        config = configuration.HpethreeparConfiguration.model_validate(data)
+
+        assert config.hpe3par_debug == "true"
+        assert data == original
+
+    def test_hpe3par_configuration_is_frozen(self):
+        """Validated configurations cannot be modified."""
+        config = configuration.HpethreeparConfiguration(
+            **{
+                "volume-backend-name": "hpe3par01",
+                "san-ip": "10.0.0.10",
+                "san-login": "admin",
+                "san-password": "secret",
+            }
+        )
+        with pytest.raises(pydantic.ValidationError):
+            config.san_login = "other"
+
 
 class TestSolidfireConfiguration:
     """Test the SolidfireConfiguration class."""
@@ -2254,3 +2285,77 @@ class TestRootConfiguration:
 
         assert "infinibox01" in config.infinidat
         assert config.infinidat["infinibox01"].volume_backend_name == "infinibox01"
+
+    def _ceph(self, name, pool):
+        return {
+            "volume-backend-name": name,
+            "mon-hosts": "10.0.0.1",
+            "rbd-pool": pool,
+            "rbd-user": "cinder",
+            "rbd-secret-uuid": "uuid",
+            "rbd-key": "key",
+        }
+
+    def test_root_configuration_rejects_duplicate_backend_names(self):
+        """Backend names must be unique across backend types."""
+        with pytest.raises(
+            pydantic.ValidationError,
+            match="Duplicate backend name 'shared' found in infinidat backend 'ibox'",
+        ):
+            configuration.Configuration(
+                database={"url": "sqlite:///test.db"},
+                rabbitmq={"url": "amqp://localhost"},
+                cinder={"project-id": "project-id", "user-id": "user-id"},
+                ceph={"ceph01": self._ceph("shared", "volumes")},
+                infinidat={
+                    "ibox": {
+                        "volume-backend-name": "shared",
+                        "san-ip": "10.0.0.100",
+                        "san-login": "admin",
+                        "san-password": "secret",
+                        "infinidat-pool-name": "cinder-pool",
+                        "protocol": "fc",
+                    }
+                },
+            )
+
+    def test_root_configuration_rejects_duplicate_ceph_pools(self):
+        """Ceph backends must not share a pool."""
+        with pytest.raises(
+            pydantic.ValidationError,
+            match="Duplicate Ceph pool 'volumes' found in backend 'ceph02'",
+        ):
+            configuration.Configuration(
+                database={"url": "sqlite:///test.db"},
+                rabbitmq={"url": "amqp://localhost"},
+                cinder={"project-id": "project-id", "user-id": "user-id"},
+                ceph={
+                    "ceph01": self._ceph("ceph01", "volumes"),
+                    "ceph02": self._ceph("ceph02", "volumes"),
+                },
+            )
+
+
+class TestSchemaBuild:
+    def test_models_are_complete_at_import(self):
+        """Validators are built when the module is imported, not on first use."""
+        models = [
+            value
+            for value in vars(configuration).values()
+            if isinstance(value, type)
+            and issubclass(value, pydantic.BaseModel)
+            and value.__module__ == configuration.__name__
+        ]
+
+        assert models
+        for model in models:
+            assert model.__pydantic_complete__, model.__name__
+            assert isinstance(
+                model.__pydantic_validator__, pydantic_core.SchemaValidator
+            ), model.__name__
+
+    def test_aliases_are_resolved_at_class_creation(self):
+        """Generated aliases are stored on the fields, not computed per use."""
+        field = configuration.HitachiConfiguration.model_fields["hitachi_storage_id"]
+        assert field.validation_alias == "hitachi-storage-id"
+        assert field.serialization_alias == "hitachi_storage_id"
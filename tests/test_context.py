@@ -3,9 +3,20 @@
 
 from unittest.mock import Mock
 
+import pytest
+
 from cinder_volume import context
 
 
+class TestContext:
+    """Test the Context base class."""
+
+    def test_context_not_implemented(self):
+        """Test the base context method must be overridden."""
+        with pytest.raises(NotImplementedError):
+            context.Context().context()
+
+
 class TestConfigContext:
     """Test the ConfigContext class."""
 
@@ -27,28 +38,36 @@ class TestConfigContext:
 class TestSnapPathContext:
     """Test the SnapPathContext class."""
 
-    def test_snap_path_context_creation(self):
+    def test_snap_path_context_creation(self, fake_snap):
         """Test creating a SnapPathContext instance."""
-        mock_snap = Mock()
-        mock_snap.paths.__slots__ = ["common", "data"]
-        mock_snap.paths.common = "/snap/common"
-        mock_snap.paths.data = "/snap/data"
-
-        ctx = context.SnapPathContext(snap=mock_snap)
-        assert ctx.snap == mock_snap
+        ctx = context.SnapPathContext(snap=fake_snap)
+        assert ctx.snap == fake_snap
         assert ctx.namespace == "snap_paths"
 
-    def test_snap_path_context_method(self):
+    def test_snap_path_context_method(self, fake_snap):
         """Test the context method of SnapPathContext."""
+        ctx = context.SnapPathContext(snap=fake_snap)
+        result = ctx.context()
+        expected = {"common": "/snap/common", "data": "/snap/data"}
+        assert result == expected
+
+    def test_snap_path_context_single_path(self):
+        """Test the context method with a single snap path."""
         mock_snap = Mock()
-        mock_snap.paths.__slots__ = ["common", "data"]
+        mock_snap.paths.__slots__ = ["common"]
         mock_snap.paths.common = "/snap/common"
-        mock_snap.paths.data = "/snap/data"
 
         ctx = context.SnapPathContext(snap=mock_snap)
+        assert ctx.context() == {"common": "/snap/common"}
+
+    def test_snap_path_context_is_read_once(self, fake_snap):
+        """Test snap paths are only read on the first call."""
+        ctx = context.SnapPathContext(snap=fake_snap)
         result = ctx.context()
-        expected = {"common": "/snap/common", "data": "/snap/data"}
-        assert result == expected
+        fake_snap.paths.common = "/other"
+
+        assert ctx.context() is result
+        assert result["common"] == "/snap/common"
 
 
 class TestCABundleSet:
@@ -2,8 +2,6 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import logging
-import tempfile
-from pathlib import Path
 
 from cinder_volume import log
 
@@ -11,17 +9,15 @@ from cinder_volume import log
 class TestSetupLogging:
     """Test the setup_logging function."""
 
-    def test_setup_logging_with_path(self):
+    def test_setup_logging_with_path(self, tmp_path):
         """Test setup_logging with a Path object."""
-        with tempfile.NamedTemporaryFile(delete=False) as tmp:
-            logfile = Path(tmp.name)
+        logfile = tmp_path / "test.log"
 
+        # Clear existing handlers to ensure clean test
+        root_logger = logging.getLogger()
+        original_handlers = root_logger.handlers[:]
+        root_logger.handlers.clear()
         try:
-            # Clear existing handlers to ensure clean test
-            root_logger = logging.getLogger()
-            original_handlers = root_logger.handlers[:]
-            root_logger.handlers.clear()
-
             log.setup_logging(logfile)
 
             # Check that a handler was added to the root logger
@@ -39,22 +35,17 @@ class TestSetupLogging:
             assert file_handler.baseFilename == str(logfile)
         finally:
             # Restore original handlers
-            root_logger = logging.getLogger()
             root_logger.handlers = original_handlers
-            # Clean up
-            logfile.unlink(missing_ok=True)
 
-    def test_setup_logging_with_string(self):
+    def test_setup_logging_with_string(self, tmp_path):
         """Test setup_logging with a string path."""
-        with tempfile.NamedTemporaryFile(delete=False) as tmp:
-            logfile = tmp.name
+        logfile = str(tmp_path / "test.log")
 
+        # Clear existing handlers to ensure clean test
+        root_logger = logging.getLogger()
+        original_handlers = root_logger.handlers[:]
+        root_logger.handlers.clear()
         try:
-            # Clear existing handlers to ensure clean test
-            root_logger = logging.getLogger()
-            original_handlers = root_logger.handlers[:]
-            root_logger.handlers.clear()
-
             log.setup_logging(logfile)
 
             # Check that a handler was added to the root logger
@@ -62,7 +53,74 @@ class TestSetupLogging:
             assert len(handlers) > 0
         finally:
             # Restore original handlers
-            root_logger = logging.getLogger()
             root_logger.handlers = original_handlers
-            # Clean up
-            Path(logfile).unlink(missing_ok=True)
+
+
+class TestBufferedFileHandler:
+    """Test the buffered file handler used by setup_logging."""
+
+    def test_flushes_on_warning(self, tmp_path):
+        """Test debug records are buffered until a warning is logged."""
+        logfile = tmp_path / "test.log"
+        handler = log._BufferedFileHandler(str(logfile), mode="a", delay=True)
+        logger = logging.getLogger("cinder_volume.tests.buffered")
+        logger.propagate = False
+        logger.setLevel(logging.DEBUG)
+        logger.addHandler(handler)
+        try:
+            logger.debug("buffered")
+            assert "buffered" not in logfile.read_text()
+
+            logger.warning("flushed")
+            content = logfile.read_text()
+            assert "buffered" in content
+            assert "flushed" in content
+        finally:
+            logger.removeHandler(handler)
+            handler.close()
+
+
+class TestLogLevel:
+    """Test the level selected by setup_logging."""
+
+    def _setup(self, tmp_path, monkeypatch, debug):
+        if debug:
+            monkeypatch.setenv("CINDER_VOLUME_DEBUG", "1")
+        else:
+            monkeypatch.delenv("CINDER_VOLUME_DEBUG", raising=False)
+        root_logger = logging.getLogger()
+        monkeypatch.setattr(root_logger, "handlers", [])
+        monkeypatch.setattr(root_logger, "level", root_logger.level)
+        log.setup_logging(tmp_path / "test.log")
+        level = root_logger.level
+        for handler in root_logger.handlers:
+            handler.close()
+        return level
+
+    def test_defaults_to_info(self, tmp_path, monkeypatch):
+        """Test the root logger defaults to INFO."""
+        assert self._setup(tmp_path, monkeypatch, debug=False) == logging.INFO
+
+    def test_debug_from_environment(self, tmp_path, monkeypatch):
+        """Test CINDER_VOLUME_DEBUG enables DEBUG."""
+        assert self._setup(tmp_path, monkeypatch, debug=True) == logging.DEBUG
+
+
+class TestSetupLoggingIdempotent:
+    """Test setup_logging can be called several times."""
+
+    def test_same_file_configured_once(self, tmp_path, monkeypatch):
+        """Test a second call for the same file adds no handler."""
+        root_logger = logging.getLogger()
+        monkeypatch.setattr(root_logger, "handlers", [])
+        monkeypatch.setattr(root_logger, "level", root_logger.level)
+        logfile = tmp_path / "test.log"
+
+        log.setup_logging(logfile)
+        log.setup_logging(str(logfile))
+
+        try:
+            assert len(root_logger.handlers) == 1
+        finally:
+            for handler in root_logger.handlers:
+                handler.close()
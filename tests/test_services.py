@@ -0,0 +1,88 @@
+# SPDX-FileCopyrightText: 2025 - Canonical Ltd
+# SPDX-License-Identifier: Apache-2.0
+
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from cinder_volume import services
+
+
+class TestRegistration:
+    """Test service registration."""
+
+    def test_cinder_volume_registered(self):
+        """Test the cinder-volume service is registered."""
+        assert services.services() == (services.CinderVolume,)
+
+    def test_subclass_not_registered(self):
+        """Test defining a subclass does not register it."""
+        before = services.services()
+
+        class ExtraService(services.OpenStackService):
+            name = "extra"
+            executable = Path("usr/bin/extra")
+
+        assert services.services() == before
+
+
+class TestCinderVolumeService:
+    """Test the cinder-volume service entry point."""
+
+    def test_config_args(self):
+        """Test configuration arguments are built under the common path."""
+        args = services.CinderVolume._config_args("/var/snap/test/common")
+
+        assert args == (
+            "--config-file",
+            "/var/snap/test/common/etc/cinder/cinder.conf",
+            "--config-file",
+            "/var/snap/test/common/etc/cinder/rootwrap.conf",
+            "--config-dir",
+            "/var/snap/test/common/etc/cinder/cinder.conf.d",
+        )
+        assert services.CinderVolume._config_args("/var/snap/test/common") is args
+
+    def test_run(self, tmp_path):
+        """Test run replaces the process with the service executable."""
+        snap = Mock()
+        snap.name = "cinder-volume"
+        snap.paths.common = tmp_path / "common"
+        snap.paths.snap = Path("/snap/cinder-volume/current")
+
+        with (
+            patch.object(services.log, "setup_logging") as setup_logging,
+            patch.object(services.logging, "shutdown"),
+            patch.object(services.os, "execv") as execv,
+        ):
+            execv.side_effect = SystemExit(0)
+            with pytest.raises(SystemExit):
+                services.CinderVolume().run(snap)
+
+        setup_logging.assert_called_once_with(
+            str(snap.paths.common / "cinder-volume-cinder-volume.log")
+        )
+        path, cmd = execv.call_args.args
+        assert path == "/snap/cinder-volume/current/usr/bin/cinder-volume"
+        assert cmd[0] == path
+        assert cmd[1:] == list(
+            services.CinderVolume._config_args(str(snap.paths.common))
+        )
+
+    def test_run_exec_failure(self, tmp_path):
+        """Test run exits with 127 when the executable cannot be started."""
+        snap = Mock()
+        snap.name = "cinder-volume"
+        snap.paths.common = tmp_path / "common"
+        snap.paths.snap = tmp_path / "snap"
+
+        with (
+            patch.object(services.log, "setup_logging"),
+            patch.object(services.logging, "shutdown"),
+            patch.object(services.os, "execv", side_effect=FileNotFoundError),
+            pytest.raises(SystemExit) as exc,
+        ):
+            services.CinderVolume().run(snap)
+
+        assert exc.value.code == 127
@@ -1,8 +1,11 @@
 # SPDX-FileCopyrightText: 2025 - Canonical Ltd
 # SPDX-License-Identifier: Apache-2.0
 
+import dataclasses
 from pathlib import Path
 
+import pytest
+
 from cinder_volume import template
 
 
@@ -23,6 +26,16 @@ class TestDirectory:
         assert dir_obj.mode == 0o750
         assert dir_obj.location == "common"
 
+    def test_directory_equality(self):
+        """Test Directory equality and hashing."""
+        a = template.Directory(path="test/path")
+        b = template.CommonDirectory(path=Path("test/path"))
+
+        assert a == b
+        assert hash(a) == hash(b)
+        assert a != template.DataDirectory(path="test/path")
+        assert a != template.Directory(path="test/path", mode=0o700)
+
 
 class TestCommonDirectory:
     """Test the CommonDirectory class."""
@@ -97,6 +110,30 @@ class TestTemplate:
         )
         assert tpl.template() == "custom.j2"
 
+    def test_template_should_render(self):
+        """Test should_render evaluates the template conditionals."""
+        always = template.Template(src="a.j2", dest=Path("/dest"))
+        never = template.Template(
+            src="b.j2", dest=Path("/dest"), conditionals=[lambda ctx: False]
+        )
+        keyed = template.Template(
+            src="c.j2",
+            dest=Path("/dest"),
+            conditionals=[template.true_conditional, lambda ctx: "key" in ctx],
+        )
+
+        assert always.should_render({})
+        assert not never.should_render({})
+        assert not keyed.should_render({})
+        assert keyed.should_render({"key": 1})
+
+    def test_template_is_frozen(self):
+        """Test Template attributes cannot be reassigned."""
+        tpl = template.DataTemplate(src="test.j2", dest=Path("/dest"))
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            tpl.mode = 0o600  # type: ignore[misc]
+        assert not hasattr(tpl, "__dict__")
+
     def test_template_output_path(self):
         """Test the rendered output path."""
         tpl = template.Template(